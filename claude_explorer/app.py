@@ -5,10 +5,13 @@ from __future__ import annotations
 import argparse
 import re
 import sys
+import time
 from pathlib import Path
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import Footer, TabbedContent, TabPane
 
 from .data.models import Session
@@ -26,6 +29,28 @@ from .screens.settings import SettingsScreen
 
 CSS_PATH = Path(__file__).parent / "styles" / "app.tcss"
 
+EXPORT_DIR = Path.home() / "claude-exports"
+_EXPORT_DIR_RESOLVED = EXPORT_DIR.resolve()
+
+# Screen class per tab; all but the initial tab are mounted on first visit
+TAB_SCREENS: dict[str, type[Widget]] = {
+    "dashboard": DashboardScreen,
+    "sessions": SessionsScreen,
+    "conversation": ConversationScreen,
+    "search": SearchScreen,
+    "projects": ProjectsScreen,
+    "plans": PlansScreen,
+    "stats": StatsScreen,
+    "file-history": FileHistoryScreen,
+    "todos": TodosScreen,
+    "settings": SettingsScreen,
+}
+
+# Repeated refresh presses within this window collapse into one reload
+REFRESH_DEBOUNCE = 0.5
+# Session opens closer together than this are coalesced into the last one
+SESSION_LOAD_DEBOUNCE = 0.15
+
 
 def _safe_filename(name: str) -> str:
     """Sanitize a string for use as a filename."""
@@ -57,28 +82,28 @@ class ClaudeExplorer(App):
         Binding("escape", "go_back", "Back", show=True),
     ]
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._last_refresh = 0.0
+        self._refresh_pending = False
+        self._last_session_load = 0.0
+        self._pending_session_load: Timer | None = None
+
     def compose(self) -> ComposeResult:
+        # Only the dashboard is built up front: every screen parses its data
+        # on mount, so the rest wait until their tab is first opened.
         with TabbedContent(id="main-tabs"):
             with TabPane("Dashboard", id="dashboard"):
                 yield DashboardScreen()
-            with TabPane("Sessions", id="sessions"):
-                yield SessionsScreen()
-            with TabPane("Conversation", id="conversation"):
-                yield ConversationScreen()
-            with TabPane("Search", id="search"):
-                yield SearchScreen()
-            with TabPane("Projects", id="projects"):
-                yield ProjectsScreen()
-            with TabPane("Plans", id="plans"):
-                yield PlansScreen()
-            with TabPane("Stats", id="stats"):
-                yield StatsScreen()
-            with TabPane("File History", id="file-history"):
-                yield FileHistoryScreen()
-            with TabPane("Todos", id="todos"):
-                yield TodosScreen()
-            with TabPane("Settings", id="settings"):
-                yield SettingsScreen()
+            yield TabPane("Sessions", id="sessions")
+            yield TabPane("Conversation", id="conversation")
+            yield TabPane("Search", id="search")
+            yield TabPane("Projects", id="projects")
+            yield TabPane("Plans", id="plans")
+            yield TabPane("Stats", id="stats")
+            yield TabPane("File History", id="file-history")
+            yield TabPane("Todos", id="todos")
+            yield TabPane("Settings", id="settings")
         yield Footer()
 
     def on_mount(self) -> None:
@@ -86,6 +111,24 @@ class ClaudeExplorer(App):
         tabs = self.query_one("#main-tabs", TabbedContent)
         conv_tab = tabs.get_tab("conversation")
         conv_tab.display = False
+        # Parse the other tabs' data while the user looks at the dashboard
+        from .data.parsers import warm_cache
+        self.run_worker(warm_cache, thread=True, name="warm_cache", exit_on_error=False)
+
+    async def _ensure_screen(self, tab_id: str) -> Widget:
+        """Return the screen for a tab, mounting it on first use."""
+        pane = self.query_one(f"#{tab_id}", TabPane)
+        screen_cls = TAB_SCREENS[tab_id]
+        existing = pane.query(screen_cls)
+        if existing:
+            return existing.first()
+        screen = screen_cls()
+        await pane.mount(screen)
+        return screen
+
+    async def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
+        if event.pane.id in TAB_SCREENS:
+            await self._ensure_screen(event.pane.id)
 
     def action_switch_tab(self, tab_id: str) -> None:
         tabs = self.query_one("#main-tabs", TabbedContent)
@@ -100,69 +143,113 @@ class ClaudeExplorer(App):
             tabs.active = "sessions"
 
     def action_refresh(self) -> None:
-        """Refresh all data."""
+        """Refresh all data, coalescing rapid repeated presses."""
+        if time.monotonic() - self._last_refresh < REFRESH_DEBOUNCE:
+            if not self._refresh_pending:
+                self._refresh_pending = True
+                self.set_timer(REFRESH_DEBOUNCE, self._do_refresh)
+            return
+        self._do_refresh()
+
+    def _do_refresh(self) -> None:
         from .data.parsers import refresh_data
+        self._refresh_pending = False
+        self._last_refresh = time.monotonic()
         refresh_data()
         self.notify("Data refreshed", title="Claude Explorer")
         # Reload current screen
         tabs = self.query_one("#main-tabs", TabbedContent)
         active = tabs.active
-        if active == "dashboard":
-            self.query_one(DashboardScreen).load_dashboard()
-        elif active == "sessions":
-            self.query_one(SessionsScreen).load_sessions()
-        elif active == "projects":
-            self.query_one(ProjectsScreen).load_projects()
-        elif active == "stats":
-            self.query_one(StatsScreen).load_stats()
-        elif active == "file-history":
-            self.query_one(FileHistoryScreen).load_data()
-        elif active == "plans":
-            self.query_one(PlansScreen).load_plans()
-        elif active == "todos":
-            self.query_one(TodosScreen).load_data()
-        elif active == "settings":
-            self.query_one(SettingsScreen).load_settings()
-
-    def _open_session(self, session: Session) -> None:
+        with self.batch_update():
+            if active == "dashboard":
+                self.query_one(DashboardScreen).load_dashboard()
+            elif active == "sessions":
+                self.query_one(SessionsScreen).load_sessions()
+            elif active == "projects":
+                self.query_one(ProjectsScreen).load_projects()
+            elif active == "stats":
+                self.query_one(StatsScreen).load_stats()
+            elif active == "file-history":
+                self.query_one(FileHistoryScreen).load_data()
+            elif active == "plans":
+                self.query_one(PlansScreen).load_plans()
+            elif active == "todos":
+                self.query_one(TodosScreen).load_data()
+            elif active == "settings":
+                self.query_one(SettingsScreen).load_settings()
+
+    async def _open_session(self, session: Session) -> None:
         """Open a session in the conversation viewer."""
+        conversation = await self._ensure_screen("conversation")
         tabs = self.query_one("#main-tabs", TabbedContent)
-        tabs.get_tab("conversation").display = True
-        tabs.active = "conversation"
-        self.query_one(ConversationScreen).load_session(session)
+        # One repaint for the tab switch and the viewer's loading state
+        with self.batch_update():
+            tabs.get_tab("conversation").display = True
+            tabs.active = "conversation"
 
-    def on_session_selected(self, event: SessionSelected) -> None:
-        self._open_session(event.session)
+            # Load right away unless another open just happened; in a burst,
+            # only the last session selected is actually parsed.
+            if self._pending_session_load:
+                self._pending_session_load.stop()
+                self._pending_session_load = None
+            if time.monotonic() - self._last_session_load >= SESSION_LOAD_DEBOUNCE:
+                self._load_conversation(conversation, session)
+            else:
+                self._pending_session_load = self.set_timer(
+                    SESSION_LOAD_DEBOUNCE,
+                    lambda: self._load_conversation(conversation, session),
+                )
 
-    def on_search_session_selected(self, event: SearchSessionSelected) -> None:
-        self._open_session(event.session)
+    def _load_conversation(self, conversation: ConversationScreen, session: Session) -> None:
+        self._pending_session_load = None
+        self._last_session_load = time.monotonic()
+        conversation.load_session(session)
 
-    def on_todo_session_selected(self, event: TodoSessionSelected) -> None:
-        self._open_session(event.session)
+    async def on_session_selected(self, event: SessionSelected) -> None:
+        await self._open_session(event.session)
 
-    def on_project_selected(self, event: ProjectSelected) -> None:
+    async def on_search_session_selected(self, event: SearchSessionSelected) -> None:
+        await self._open_session(event.session)
+
+    async def on_todo_session_selected(self, event: TodoSessionSelected) -> None:
+        await self._open_session(event.session)
+
+    async def on_project_selected(self, event: ProjectSelected) -> None:
         """Navigate to sessions filtered by project."""
+        sessions_screen = await self._ensure_screen("sessions")
         tabs = self.query_one("#main-tabs", TabbedContent)
         tabs.active = "sessions"
-        sessions_screen = self.query_one(SessionsScreen)
         sessions_screen.filter_by_project(event.project_name)
 
     def on_export_requested(self, event: ExportRequested) -> None:
         """Export conversation to markdown file."""
+        session = event.session
+        if not session.jsonl_path:
+            return
+        EXPORT_DIR.mkdir(exist_ok=True)
+        date_str = session.last_activity.strftime("%Y%m%d-%H%M") if session.last_activity else "unknown"
+        filename = f"{_safe_filename(session.project_short)}-{date_str}.md"
+        export_path = (EXPORT_DIR / filename).resolve()
+        # Ensure export stays within the export dir
+        if not export_path.is_relative_to(_EXPORT_DIR_RESOLVED):
+            self.notify("Invalid export path", title="Error", severity="error")
+            return
+        # Large sessions take a while to render; write in the background
+        self.run_worker(
+            lambda: self._write_export(session, export_path),
+            thread=True,
+            name="export_conversation",
+        )
+
+    def _write_export(self, session: Session, export_path: Path) -> None:
         from .data.parsers import export_conversation_markdown
-        content = export_conversation_markdown(event.session)
-        if content:
-            export_dir = Path.home() / "claude-exports"
-            export_dir.mkdir(exist_ok=True)
-            date_str = event.session.last_activity.strftime("%Y%m%d-%H%M") if event.session.last_activity else "unknown"
-            filename = f"{_safe_filename(event.session.project_short)}-{date_str}.md"
-            export_path = (export_dir / filename).resolve()
-            # Ensure export stays within export_dir
-            if not str(export_path).startswith(str(export_dir.resolve())):
-                self.notify("Invalid export path", title="Error", severity="error")
-                return
-            export_path.write_text(content, encoding="utf-8")
-            self.notify(f"Exported to {export_path}", title="Export")
+        try:
+            with export_path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+                export_conversation_markdown(session, f)
+        except OSError as e:
+            self.call_from_thread(self.notify, f"Export failed: {e}", title="Error", severity="error")
+            return
+        self.call_from_thread(self.notify, f"Exported to {export_path}", title="Export")
 
 
 def main():
@@ -2,17 +2,40 @@
 
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
 _HOME = str(Path.home())
+_HOME_SLASH = _HOME + "/"
 _HOME_ENCODED = _HOME.replace("/", "-")
+_PREFIX_PROJECTS = _HOME_ENCODED + "-Projects-"
+_PREFIX_HOME = _HOME_ENCODED + "-"
+
+_MARKUP_TABLE = str.maketrans({"[": "\\[", "]": "\\]"})
+
+# Stand-in for a missing timestamp; sorts before any real one
+DATETIME_MIN_UTC = datetime.min.replace(tzinfo=timezone.utc)
+
+# Bound once for Prompt.timestamp; a positional tz skips keyword handling
+_UTC = timezone.utc
+_fromtimestamp = datetime.fromtimestamp
 
 
 def escape_markup(text: str) -> str:
     """Escape Rich markup brackets in user-derived text."""
-    return text.replace("[", "\\[").replace("]", "\\]")
+    return text.translate(_MARKUP_TABLE)
+
+
+def _div_round(n: int, shift: int) -> int:
+    """n / 2**shift rounded half-to-even, matching float formatting."""
+    q, r = n >> shift, n & ((1 << shift) - 1)
+    half = 1 << (shift - 1)
+    if r > half or (r == half and q & 1):
+        q += 1
+    return q
 
 
 def format_size(size_bytes: int) -> str:
@@ -20,22 +43,36 @@ def format_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0B"
     if size_bytes > 1024 * 1024:
-        return f"{size_bytes / 1024 / 1024:.1f}MB"
+        tenths = _div_round(size_bytes * 10, 20)
+        return f"{tenths // 10}.{tenths % 10}MB"
     if size_bytes > 1024:
-        return f"{size_bytes / 1024:.0f}KB"
+        return f"{_div_round(size_bytes, 10)}KB"
     return f"{size_bytes}B"
 
 
+def format_duration(start: datetime | None, end: datetime | None) -> str:
+    """Format the span between two timestamps, e.g. '42m' or '3h05m'."""
+    if start and end:
+        mins = int((end - start).total_seconds() / 60)
+        if mins < 60:
+            return f"{mins}m"
+        hours = mins // 60
+        remaining = mins % 60
+        return f"{hours}h{remaining:02d}m"
+    return "?"
+
+
+@lru_cache(maxsize=4096)
 def shorten_path(path: str) -> str:
     """Replace the user's home directory with ~/ in a path."""
-    home_slash = _HOME + "/"
-    if path.startswith(home_slash):
-        return "~/" + path[len(home_slash):]
+    if path.startswith(_HOME_SLASH):
+        return "~/" + path[len(_HOME_SLASH):]
     if path == _HOME:
         return "~"
     return path
 
 
+@lru_cache(maxsize=4096)
 def shorten_project_dir(name: str) -> str:
     """Convert a .claude project directory name to a readable name.
 
@@ -44,41 +81,49 @@ def shorten_project_dir(name: str) -> str:
     'home-mehmet--claude' -> '~/.claude'
     'home-mehmet-Projects' -> 'Projects'
     """
-    prefix_projects = _HOME_ENCODED + "-Projects-"
-    prefix_home = _HOME_ENCODED + "-"
     # e.g. "home-mehmet-Projects-istiqami" -> "istiqami"
-    if name.startswith(prefix_projects):
-        result = name[len(prefix_projects):]
+    if name.startswith(_PREFIX_PROJECTS):
+        result = name[len(_PREFIX_PROJECTS):]
         return result if result else "Projects"
     # e.g. "home-mehmet-Projects" (exact match, no trailing dash)
     if name == _HOME_ENCODED + "-Projects":
         return "Projects"
     # e.g. "home-mehmet--claude" -> suffix is "-claude" -> "~/.claude"
-    if name.startswith(prefix_home):
-        suffix = name[len(prefix_home):]
-        if suffix.startswith("-"):
+    if name.startswith(_PREFIX_HOME):
+        suffix = name[len(_PREFIX_HOME):]
+        if suffix[:1] == "-":
             # Double dash encodes a dot directory: --claude -> .claude
-            return "~/" + "." + suffix[1:]
+            return "~/." + suffix[1:]
         return "~/" + suffix if suffix else "~"
     if name == _HOME_ENCODED:
         return "~"
     return name
 
 
-@dataclass
+@dataclass(slots=True)
 class Prompt:
     """A single user prompt from history.jsonl."""
     text: str
-    timestamp: datetime
+    timestamp_ms: int  # epoch milliseconds, as stored in history.jsonl; 0 if missing
     project: str
     session_id: str
 
+    @property
+    def timestamp(self) -> datetime:
+        """Built on access: most prompts are only ever sorted and counted."""
+        if self.timestamp_ms:
+            try:
+                return _fromtimestamp(self.timestamp_ms / 1000, _UTC)
+            except (ValueError, OverflowError, OSError):
+                pass
+        return DATETIME_MIN_UTC
+
     @property
     def project_short(self) -> str:
         return shorten_path(self.project)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMessage:
     """A message within a session transcript."""
     role: str
@@ -88,7 +133,7 @@ class SessionMessage:
     message_type: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """A Claude session with metadata."""
     session_id: str
@@ -100,29 +145,29 @@ class Session:
     message_count: int = 0
     jsonl_path: Path | None = None
     jsonl_size: int = 0
+    # Display strings, computed once rather than on every table render
+    size_str: str = field(default="", init=False)
+    duration_str: str = field(default="?", init=False)
+    date_str: str = field(default="?", init=False)  # last activity, "%Y-%m-%d %H:%M"
+
+    def __post_init__(self) -> None:
+        # Resolve the display name once; project_short is read on every row render
+        if not self.project:
+            self.project = shorten_project_dir(self.project_path)
+        self.size_str = format_size(self.jsonl_size)
+        self.update_activity()
 
     @property
     def project_short(self) -> str:
-        return self.project or shorten_project_dir(self.project_path)
-
-    @property
-    def duration_str(self) -> str:
-        if self.first_activity and self.last_activity:
-            delta = self.last_activity - self.first_activity
-            mins = int(delta.total_seconds() / 60)
-            if mins < 60:
-                return f"{mins}m"
-            hours = mins // 60
-            remaining = mins % 60
-            return f"{hours}h{remaining:02d}m"
-        return "?"
+        return self.project
 
-    @property
-    def size_str(self) -> str:
-        return format_size(self.jsonl_size)
+    def update_activity(self) -> None:
+        """Recompute duration_str and date_str after first/last activity change."""
+        self.duration_str = format_duration(self.first_activity, self.last_activity)
+        self.date_str = self.last_activity.strftime("%Y-%m-%d %H:%M") if self.last_activity else "?"
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyStats:
     """Daily activity stats."""
     date: str
@@ -131,7 +176,7 @@ class DailyStats:
     tool_call_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelUsage:
     """Token usage statistics for a single model."""
     model_id: str
@@ -158,7 +203,7 @@ class ModelUsage:
         return self.input_tokens + self.output_tokens + self.cache_read_tokens + self.cache_creation_tokens
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoItem:
     """A single todo task item."""
     id: str
@@ -167,7 +212,7 @@ class TodoItem:
     priority: str = "normal"  # "high" | "normal" | "low"
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionTodos:
     """Todo list for a session."""
     session_id: str
@@ -187,7 +232,7 @@ class SessionTodos:
         return sum(1 for t in self.items if t.status == "completed")
 
 
-@dataclass
+@dataclass(slots=True)
 class GlobalStats:
     """Aggregate stats for the dashboard."""
     total_messages: int = 0
@@ -201,13 +246,13 @@ class GlobalStats:
     active_days: int = 0
     daily_stats: list[DailyStats] = field(default_factory=list)
     model_usages: list[ModelUsage] = field(default_factory=list)
-    hour_counts: dict[int, int] = field(default_factory=dict)
+    hour_counts: array[int] = field(default_factory=lambda: array("I", [0] * 24))  # index = hour
     longest_session_id: str = ""
     longest_session_duration_ms: int = 0
     longest_session_msgs: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaudeJsonProject:
     """Per-project settings from ~/.claude.json."""
     path: str
@@ -228,7 +273,7 @@ class ClaudeJsonProject:
         return f"${self.last_cost:.4f}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Plan:
     """A plan document."""
     name: str
@@ -238,7 +283,7 @@ class Plan:
     size: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """A project with its sessions."""
     name: str
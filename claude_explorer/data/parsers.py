@@ -2,11 +2,31 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import mmap
+import os
+import pickle
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import BinaryIO, TextIO
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
 
 from .models import (
+    DATETIME_MIN_UTC,
     ClaudeJsonProject,
     DailyStats,
     GlobalStats,
@@ -22,122 +42,385 @@ from .models import (
 )
 
 CLAUDE_DIR = Path.home() / ".claude"
+CLAUDE_JSON = Path.home() / ".claude.json"
+
+# orjson decodes str or bytes several times faster than the stdlib, and its
+# JSONDecodeError subclasses json.JSONDecodeError, so except clauses stay as-is.
+_loads = orjson.loads if orjson is not None else json.loads
+
+# Parsed results persisted across runs, keyed by input file fingerprints
+CACHE_DIR = Path.home() / ".cache" / "claude-explorer"
+_CACHE_FORMAT = 6  # bump when model classes change shape
+
+# Thread count for I/O-bound fan-out over many small files
+_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Sort key for prompts. history.jsonl is appended in time order, so Timsort
+# finds it as one run; the key calls are most of what remains.
+_PROMPT_TIME = attrgetter("timestamp_ms")
+
+# Read size for JSONL files
+_READ_CHUNK = 1 << 20
+
+# Deep-search result sets kept for repeated queries
+MAX_CACHED_SEARCHES = 32
+
+# Cap on a single message body; huge tool outputs would otherwise stall rendering
+MAX_CONTENT_CHARS = 100_000
 
 
 # --- Cache layer ---
 
+# Cache entries backed by fixed files, grouped by the files they read.
+# refresh() keeps these while their files are unchanged; directory scans
+# (projects, sessions, file history, todos) are cheap and always reloaded.
+_FILE_GROUPS: dict[str, tuple[str, ...]] = {
+    "history": ("_history_unsorted", "_history", "_history_mark"),
+    "stats": ("_stats", "_raw_stats_json", "_model_usages", "_hour_counts", "_longest_session"),
+    "settings": ("_settings",),
+    "claude_json": ("_claude_json_projects",),
+}
+
+
+def _group_inputs(group: str) -> list[Path]:
+    if group == "history":
+        return [CLAUDE_DIR / "history.jsonl"]
+    if group == "stats":
+        return [CLAUDE_DIR / "stats-cache.json"]
+    if group == "settings":
+        return [CLAUDE_DIR / "settings.json"]
+    return [CLAUDE_JSON]
+
+
+# DataCache properties loaded by warm(), dashboard inputs first
+_WARM_ORDER = (
+    "stats", "history_unsorted", "projects", "model_usages", "hour_counts",
+    "longest_session", "sessions", "history", "file_history", "todos",
+    "settings", "claude_json_projects",
+)
+
+
 class DataCache:
-    """In-memory cache for parsed data."""
+    """In-memory cache for parsed data.
+
+    Loads may run from worker threads, so each one happens under a shared
+    lock: a screen asking for data that a worker is already parsing waits
+    for that result instead of parsing the same files a second time.
+    """
+
+    # Every public accessor reads these; slots make that a fixed-offset load
+    __slots__ = (
+        "_lock", "_fingerprints",
+        "_history_unsorted", "_history", "_history_mark", "_stats", "_projects", "_sessions",
+        "_file_history", "_raw_stats_json", "_model_usages", "_hour_counts",
+        "_longest_session", "_todos", "_settings", "_claude_json_projects",
+        "_searches",
+    )
 
     def __init__(self):
-        self._history: list[Prompt] | None = None
+        self._lock = threading.RLock()
+        self._fingerprints: dict[str, tuple] = {}  # file group -> inputs as of load
+        self._history_unsorted: list[Prompt] | None = None  # file order
+        self._history: list[Prompt] | None = None  # newest first
+        # Bytes of history.jsonl parsed so far and a digest of them (see _history_mark_at)
+        self._history_mark: tuple[int, bytes] | None = None
         self._stats: list[DailyStats] | None = None
         self._projects: list[Project] | None = None
         self._sessions: list[Session] | None = None
         self._file_history: dict[str, list[str]] | None = None
         self._raw_stats_json: dict | None = None  # shared backing for model/hour/longest
         self._model_usages: list[ModelUsage] | None = None
-        self._hour_counts: dict[int, int] | None = None
+        self._hour_counts: array[int] | None = None
         self._longest_session: dict | None = None
         self._todos: list[SessionTodos] | None = None
         self._settings: dict | None = None
         self._claude_json_projects: list[ClaudeJsonProject] | None = None
+        # Deep-search results, most recent last; keys carry every transcript's mtime and size
+        self._searches: OrderedDict[tuple, list[dict]] = OrderedDict()
 
     def invalidate(self):
-        self._history = None
-        self._stats = None
-        self._projects = None
-        self._sessions = None
-        self._file_history = None
-        self._raw_stats_json = None
-        self._model_usages = None
-        self._hour_counts = None
-        self._longest_session = None
-        self._todos = None
-        self._settings = None
-        self._claude_json_projects = None
+        with self._lock:
+            _parse_transcript_cached.cache_clear()
+            self._searches.clear()
+            self._fingerprints.clear()
+            self._history_unsorted = None
+            self._history = None
+            self._history_mark = None
+            self._stats = None
+            self._projects = None
+            self._sessions = None
+            self._file_history = None
+            self._raw_stats_json = None
+            self._model_usages = None
+            self._hour_counts = None
+            self._longest_session = None
+            self._todos = None
+            self._settings = None
+            self._claude_json_projects = None
+
+    @property
+    def history_unsorted(self) -> list[Prompt]:
+        prompts = self._history_unsorted
+        if prompts is None:
+            with self._lock:
+                prompts = self._history_unsorted
+                if prompts is None:
+                    self._remember("history")
+                    self._history_mark, prompts = _load_cached(
+                        "history", [CLAUDE_DIR / "history.jsonl"], _parse_history,
+                    )
+                    self._history_unsorted = prompts
+        return prompts
 
     @property
     def history(self) -> list[Prompt]:
-        if self._history is None:
-            self._history = _parse_history()
-        return self._history
+        history = self._history
+        if history is None:
+            with self._lock:
+                history = self._history
+                if history is None:
+                    history = self._history = sorted(self.history_unsorted, key=_PROMPT_TIME, reverse=True)
+        return history
+
+    def refresh(self):
+        """Drop only the entries whose source files changed since loading."""
+        with self._lock:
+            for group, attrs in _FILE_GROUPS.items():
+                fp = self._fingerprints.pop(group, None)
+                if fp is not None:
+                    current = _fingerprint(_group_inputs(group))
+                    if fp == current:
+                        self._fingerprints[group] = fp
+                        continue
+                    if group == "history" and self._extend_history(current):
+                        continue
+                for attr in attrs:
+                    setattr(self, attr, None)
+            self._projects = None
+            self._sessions = None
+            self._file_history = None
+            self._todos = None
+
+    def search_result(self, key: tuple) -> list[dict] | None:
+        with self._lock:
+            results = self._searches.get(key)
+            if results is not None:
+                self._searches.move_to_end(key)
+            return results
+
+    def store_search(self, key: tuple, results: list[dict]) -> None:
+        with self._lock:
+            self._searches[key] = results
+            while len(self._searches) > MAX_CACHED_SEARCHES:
+                self._searches.popitem(last=False)
+
+    def warm(self) -> None:
+        """Load everything the tabs display, so opening one finds it parsed.
+
+        Intended for a background thread. Loads take the cache lock, so a
+        screen asking for an entry mid-warm waits for it instead of parsing
+        it a second time; the dashboard's inputs go first.
+        """
+        for name in _WARM_ORDER:
+            getattr(self, name)
+
+    def loaded(self, *names: str) -> bool:
+        """True if every named entry is already parsed, so reading it won't block."""
+        return all(getattr(self, "_" + name) is not None for name in names)
+
+    def _extend_history(self, fingerprint: tuple) -> bool:
+        """Parse only prompts appended since the last load; False if not possible."""
+        if self._history_unsorted is None or self._history_mark is None:
+            return False
+        tail = _parse_history_tail(self._history_mark)
+        if tail is None:
+            return False
+        self._history_mark, new_prompts = tail
+        # A new list: screens may still hold the previous one
+        self._history_unsorted = self._history_unsorted + new_prompts
+        self._history = None
+        self._fingerprints["history"] = fingerprint
+        _store_cached("history", fingerprint, (self._history_mark, self._history_unsorted))
+        return True
+
+    def _remember(self, group: str) -> None:
+        # Taken before parsing, so a write racing the parse is seen as a change
+        self._fingerprints.setdefault(group, _fingerprint(_group_inputs(group)))
 
     @property
     def stats(self) -> list[DailyStats]:
-        if self._stats is None:
-            self._stats = _parse_stats()
-        return self._stats
+        stats = self._stats
+        if stats is None:
+            with self._lock:
+                stats = self._stats
+                if stats is None:
+                    self._remember("stats")
+                    stats = self._stats = _parse_stats(self.raw_stats_json)
+        return stats
 
     @property
     def projects(self) -> list[Project]:
-        if self._projects is None:
-            self._projects = _discover_projects()
-        return self._projects
+        projects = self._projects
+        if projects is None:
+            with self._lock:
+                projects = self._projects
+                if projects is None:
+                    projects = self._projects = _discover_projects()
+        return projects
 
     @property
     def sessions(self) -> list[Session]:
-        if self._sessions is None:
-            self._sessions = _discover_all_sessions(self.history, self.projects)
-        return self._sessions
+        sessions = self._sessions
+        if sessions is None:
+            with self._lock:
+                sessions = self._sessions
+                if sessions is None:
+                    sessions = self._sessions = _discover_all_sessions(self.history_unsorted, self.projects)
+        return sessions
 
     @property
     def file_history(self) -> dict[str, list[str]]:
-        if self._file_history is None:
-            self._file_history = _parse_file_history()
-        return self._file_history
+        file_history = self._file_history
+        if file_history is None:
+            with self._lock:
+                file_history = self._file_history
+                if file_history is None:
+                    file_history = self._file_history = _parse_file_history()
+        return file_history
 
     @property
     def raw_stats_json(self) -> dict:
-        if self._raw_stats_json is None:
-            self._raw_stats_json = _load_stats_json()
-        return self._raw_stats_json
+        raw_stats_json = self._raw_stats_json
+        if raw_stats_json is None:
+            with self._lock:
+                raw_stats_json = self._raw_stats_json
+                if raw_stats_json is None:
+                    self._remember("stats")
+                    raw_stats_json = self._raw_stats_json = _load_stats_json()
+        return raw_stats_json
 
     @property
     def model_usages(self) -> list[ModelUsage]:
-        if self._model_usages is None:
-            self._model_usages = _parse_model_usages(self.raw_stats_json)
-        return self._model_usages
+        model_usages = self._model_usages
+        if model_usages is None:
+            with self._lock:
+                model_usages = self._model_usages
+                if model_usages is None:
+                    model_usages = self._model_usages = _parse_model_usages(self.raw_stats_json)
+        return model_usages
 
     @property
-    def hour_counts(self) -> dict[int, int]:
-        if self._hour_counts is None:
-            self._hour_counts = _parse_hour_counts(self.raw_stats_json)
-        return self._hour_counts
+    def hour_counts(self) -> array[int]:
+        hour_counts = self._hour_counts
+        if hour_counts is None:
+            with self._lock:
+                hour_counts = self._hour_counts
+                if hour_counts is None:
+                    hour_counts = self._hour_counts = _parse_hour_counts(self.raw_stats_json)
+        return hour_counts
 
     @property
     def longest_session(self) -> dict:
-        if self._longest_session is None:
-            self._longest_session = _parse_longest_session(self.raw_stats_json)
-        return self._longest_session
+        longest_session = self._longest_session
+        if longest_session is None:
+            with self._lock:
+                longest_session = self._longest_session
+                if longest_session is None:
+                    longest_session = self._longest_session = _parse_longest_session(self.raw_stats_json)
+        return longest_session
 
     @property
     def todos(self) -> list[SessionTodos]:
-        if self._todos is None:
-            self._todos = _parse_todos()
-        return self._todos
+        todos = self._todos
+        if todos is None:
+            with self._lock:
+                todos = self._todos
+                if todos is None:
+                    todos = self._todos = _parse_todos()
+        return todos
 
     @property
     def settings(self) -> dict:
-        if self._settings is None:
-            self._settings = _parse_settings()
-        return self._settings
+        settings = self._settings
+        if settings is None:
+            with self._lock:
+                settings = self._settings
+                if settings is None:
+                    self._remember("settings")
+                    settings = self._settings = _parse_settings()
+        return settings
 
     @property
     def claude_json_projects(self) -> list[ClaudeJsonProject]:
-        if self._claude_json_projects is None:
-            self._claude_json_projects = _parse_claude_json_projects()
-        return self._claude_json_projects
+        claude_json_projects = self._claude_json_projects
+        if claude_json_projects is None:
+            with self._lock:
+                claude_json_projects = self._claude_json_projects
+                if claude_json_projects is None:
+                    self._remember("claude_json")
+                    claude_json_projects = self._claude_json_projects = _parse_claude_json_projects()
+        return claude_json_projects
 
 
 cache = DataCache()
 
 
+# --- Disk cache ---
+
+def _fingerprint(paths: list[Path]) -> tuple:
+    """Identify the current state of input files by path, mtime and size."""
+    fp = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            fp.append((str(path), None, None))
+            continue
+        fp.append((str(path), st.st_mtime_ns, st.st_size))
+    return (_CACHE_FORMAT, *fp)
+
+
+def _load_cached(key: str, inputs: list[Path], loader):
+    """Return loader() from the on-disk pickle when inputs are unchanged.
+
+    Any unreadable or stale cache file simply falls through to a fresh parse.
+    """
+    fingerprint = _fingerprint(inputs)
+    cache_file = CACHE_DIR / f"{key}.pkl"
+    try:
+        with open(cache_file, "rb") as f:
+            stored_fp, data = pickle.load(f)
+        if stored_fp == fingerprint:
+            return data
+    except Exception:
+        pass
+
+    data = loader()
+    _store_cached(key, fingerprint, data)
+    return data
+
+
+def _store_cached(key: str, fingerprint: tuple, data) -> None:
+    cache_file = CACHE_DIR / f"{key}.pkl"
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((fingerprint, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cache_file)
+    except OSError:
+        pass
+
+
 # --- Public API (use cache) ---
 
 def parse_history() -> list[Prompt]:
     return cache.history
 
+def parse_history_unsorted() -> list[Prompt]:
+    """All prompts in file order, for callers that don't need them sorted."""
+    return cache.history_unsorted
+
 def parse_stats() -> list[DailyStats]:
     return cache.stats
 
@@ -153,7 +436,7 @@ def parse_file_history() -> dict[str, list[str]]:
 def parse_model_usages() -> list[ModelUsage]:
     return cache.model_usages
 
-def parse_hour_counts() -> dict[int, int]:
+def parse_hour_counts() -> array[int]:
     return cache.hour_counts
 
 def parse_longest_session() -> dict:
@@ -169,57 +452,146 @@ def parse_claude_json_projects() -> list[ClaudeJsonProject]:
     return cache.claude_json_projects
 
 def refresh_data():
-    """Invalidate all caches and force reload."""
-    cache.invalidate()
+    """Reload everything whose source data may have changed."""
+    cache.refresh()
+
+
+def warm_cache() -> None:
+    """Parse all data ahead of use; call from a background thread."""
+    cache.warm()
+
+
+def data_loaded(*names: str) -> bool:
+    """True if each named cache entry (e.g. "todos") is already parsed."""
+    return cache.loaded(*names)
 
 
 # --- Internal parsers ---
 
-def _parse_history() -> list[Prompt]:
-    history_file = CLAUDE_DIR / "history.jsonl"
-    if not history_file.exists():
-        return []
+def _parse_history() -> tuple[tuple[int, bytes] | None, list[Prompt]]:
+    """Parse all of history.jsonl, in file order.
 
-    prompts = []
-    with open(history_file, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                data = json.loads(line)
-                ts = data.get("timestamp", 0)
-                prompts.append(Prompt(
-                    text=data.get("display", ""),
-                    timestamp=datetime.fromtimestamp(ts / 1000, tz=timezone.utc) if ts else datetime.min.replace(tzinfo=timezone.utc),
-                    project=data.get("project", "unknown"),
-                    session_id=data.get("sessionId", ""),
-                ))
-            except (json.JSONDecodeError, ValueError):
-                continue
-    return sorted(prompts, key=lambda p: p.timestamp, reverse=True)
+    Also returns a mark of how far the parse got, so a later refresh can
+    parse just what was appended after it (see _parse_history_tail).
+    """
+    try:
+        f = open(CLAUDE_DIR / "history.jsonl", "rb")
+    except OSError:
+        return None, []
+    with f:
+        prompts = list(_iter_prompts(f))
+        return _history_mark_at(f, f.tell()), prompts
 
 
-def _parse_stats() -> list[DailyStats]:
-    stats_file = CLAUDE_DIR / "stats-cache.json"
-    if not stats_file.exists():
-        return []
+# Bytes hashed at each end of the parsed part of history.jsonl
+_HISTORY_CHECK_BYTES = 4096
+
+
+def _history_mark_at(f: BinaryIO, offset: int) -> tuple[int, bytes] | None:
+    """(offset, digest of the first and last few KB before it), or None at 0.
+
+    Appends leave both windows alone; a rewrite of the file (compacted or
+    edited in place) almost always changes one of them.
+    """
+    if not offset:
+        return None
+    h = hashlib.blake2b(digest_size=16)
+    f.seek(0)
+    h.update(f.read(min(offset, _HISTORY_CHECK_BYTES)))
+    start = max(0, offset - _HISTORY_CHECK_BYTES)
+    f.seek(start)
+    h.update(f.read(offset - start))
+    return offset, h.digest()
 
+
+def _parse_history_tail(mark: tuple[int, bytes]) -> tuple[tuple[int, bytes] | None, list[Prompt]] | None:
+    """Parse prompts appended to history.jsonl after the marked offset.
+
+    Returns None when the earlier parse did not end on a complete line, or
+    the file has shrunk or been rewritten since, in which case it must be
+    parsed afresh.
+    """
+    offset, _ = mark
     try:
-        with open(stats_file, "r", encoding="utf-8", errors="replace") as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, ValueError):
-        return []
+        with open(CLAUDE_DIR / "history.jsonl", "rb") as f:
+            if os.fstat(f.fileno()).st_size < offset:
+                return None
+            if _history_mark_at(f, offset) != mark:
+                return None
+            f.seek(offset - 1)
+            if f.read(1) != b"\n":
+                return None
+            prompts = list(_iter_prompts(f))
+            return _history_mark_at(f, f.tell()), prompts
+    except OSError:
+        return None
+
+
+def _iter_jsonl_lines(f: BinaryIO) -> Iterator[bytes]:
+    """Yield raw lines (without the newline) from a binary file.
+
+    Reads 1 MiB at a time and splits with bytes.find, avoiding per-line
+    readline and decode overhead. Whitespace is left for the decoder.
+    """
+    buf = bytearray()
+    while chunk := f.read(_READ_CHUNK):
+        scan = len(buf)
+        buf += chunk
+        start = 0
+        while (end := buf.find(b"\n", scan)) != -1:
+            yield bytes(memoryview(buf)[start:end])
+            start = scan = end + 1
+        del buf[:start]
+    if buf:
+        yield bytes(buf)
+
+
+def _loads_line(line: bytes):
+    """Decode one raw JSONL line, replacing invalid UTF-8 like text mode did."""
+    try:
+        return _loads(line)
+    except ValueError:
+        return _loads(line.decode("utf-8", errors="replace"))
+
+
+def _iter_prompts(f: BinaryIO) -> Iterator[Prompt]:
+    for line in _iter_jsonl_lines(f):
+        if len(line) < 2:  # blank; "{}" is the shortest record
+            continue
+        try:
+            prompt = _prompt_from_json(_loads_line(line))
+        except (json.JSONDecodeError, ValueError):
+            continue
+        yield prompt
+
+
+def _prompt_from_json(data: dict) -> Prompt:
+    ts = data.get("timestamp") or 0
+    if not isinstance(ts, (int, float)):
+        raise ValueError(f"bad prompt timestamp: {ts!r}")
+    # project and session id repeat across thousands of prompts; share one str each.
+    # Positional args: this runs once per history line.
+    return Prompt(
+        data.get("display", ""),
+        ts,
+        sys.intern(str(data.get("project", "unknown"))),
+        sys.intern(str(data.get("sessionId", ""))),
+    )
 
-    stats = []
-    for day in data.get("dailyActivity", []):
-        stats.append(DailyStats(
+
+def _parse_stats(data: dict) -> list[DailyStats]:
+    # stats-cache.json is already aggregated per day; this only converts it
+    stats = [
+        DailyStats(
             date=day.get("date", ""),
             message_count=day.get("messageCount", 0),
             session_count=day.get("sessionCount", 0),
             tool_call_count=day.get("toolCallCount", 0),
-        ))
-    return sorted(stats, key=lambda s: s.date)
+        )
+        for day in data.get("dailyActivity", [])
+    ]
+    stats.sort(key=attrgetter("date"))
+    return stats
 
 
 def _discover_projects() -> list[Project]:
@@ -227,84 +599,130 @@ def _discover_projects() -> list[Project]:
     if not projects_dir.exists():
         return []
 
-    projects = []
-    for entry in sorted(projects_dir.iterdir()):
-        if not entry.is_dir():
-            continue
+    # Discovery only stats files, so it is I/O-bound: threads overlap the
+    # syscalls (a win on network or cold filesystems) without pickling costs.
+    with os.scandir(projects_dir) as it:
+        entries = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+    with ThreadPoolExecutor(max_workers=_IO_WORKERS) as pool:
+        projects = list(pool.map(_scan_project, entries))
+
+    return sorted(projects, key=lambda p: p.total_size, reverse=True)
 
-        name = entry.name
-        display = shorten_project_dir(name)
 
-        jsonl_files = list(entry.glob("*.jsonl"))
-        total_size = sum(f.stat().st_size for f in jsonl_files)
+def _scan_project(entry: os.DirEntry) -> Project:
+    """Build a Project with one Session per transcript file in its dir.
 
-        sessions = []
-        for jf in jsonl_files:
-            sid = jf.stem
+    A single scandir pass stats each transcript once and reuses the result
+    for both the project total and the session row.
+    """
+    name = entry.name
+    display = shorten_project_dir(name)
+
+    sessions = []
+    total_size = 0
+    with os.scandir(entry.path) as it:
+        for jf in it:
+            if not jf.name.endswith(".jsonl") or not jf.is_file():
+                continue
             stat = jf.stat()
+            total_size += stat.st_size
             sessions.append(Session(
-                session_id=sid,
+                session_id=jf.name[:-len(".jsonl")],
                 project=display,
                 project_path=name,
-                jsonl_path=jf,
+                jsonl_path=Path(jf.path),
                 jsonl_size=stat.st_size,
                 last_activity=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
             ))
-        sessions.sort(key=lambda s: s.last_activity or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
-
-        projects.append(Project(
-            name=name,
-            path=str(entry),
-            display_name=display,
-            sessions=sessions,
-            total_size=total_size,
-            session_count=len(jsonl_files),
-        ))
-
-    return sorted(projects, key=lambda p: p.total_size, reverse=True)
+    sessions.sort(key=lambda s: s.last_activity or DATETIME_MIN_UTC, reverse=True)
+
+    return Project(
+        name=name,
+        path=entry.path,
+        display_name=display,
+        sessions=sessions,
+        total_size=total_size,
+        session_count=len(sessions),
+    )
 
 
 def _discover_all_sessions(history: list[Prompt], projects: list[Project]) -> list[Session]:
-    session_prompts: dict[str, list[Prompt]] = {}
+    # One pass over history collects (count, first, last) per session,
+    # comparing raw timestamps; only the two ends become datetimes.
+    activity: dict[str, list] = {}
     for p in history:
-        session_prompts.setdefault(p.session_id, []).append(p)
+        ts = p.timestamp_ms
+        agg = activity.get(p.session_id)
+        if agg is None:
+            activity[p.session_id] = [1, p, p]
+        else:
+            agg[0] += 1
+            if ts < agg[1].timestamp_ms:
+                agg[1] = p
+            elif ts > agg[2].timestamp_ms:
+                agg[2] = p
 
     sessions = []
     for proj in projects:
         for session in proj.sessions:
-            prompts = session_prompts.get(session.session_id, [])
-            if prompts:
-                session.prompt_count = len(prompts)
-                session.first_activity = min(p.timestamp for p in prompts)
-                ts_from_prompts = max(p.timestamp for p in prompts)
+            agg = activity.get(session.session_id)
+            if agg:
+                session.prompt_count = agg[0]
+                session.first_activity = agg[1].timestamp
+                ts_from_prompts = agg[2].timestamp
                 if session.last_activity is None or ts_from_prompts > session.last_activity:
                     session.last_activity = ts_from_prompts
+                session.update_activity()
             sessions.append(session)
 
-    return sorted(sessions, key=lambda s: s.last_activity or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
+    return sorted(sessions, key=lambda s: s.last_activity or DATETIME_MIN_UTC, reverse=True)
 
 
 def parse_session_transcript(jsonl_path: Path, max_messages: int = 500) -> list[SessionMessage]:
-    """Parse a session JSONL file into messages."""
-    if not jsonl_path.exists():
+    """Parse a session JSONL file into messages.
+
+    Results are memoized on the file's size and mtime, so reopening or
+    exporting an unchanged session does not parse it again. The returned
+    list is shared between callers and must not be modified.
+    """
+    try:
+        st = jsonl_path.stat()
+    except OSError:
+        return []
+    return _parse_transcript_cached(str(jsonl_path), st.st_mtime_ns, st.st_size, max_messages)
+
+
+@lru_cache(maxsize=16)
+def _parse_transcript_cached(path: str, mtime_ns: int, size: int, max_messages: int) -> list[SessionMessage]:
+    return _parse_transcript(Path(path), max_messages)
+
+
+def _parse_transcript(jsonl_path: Path, max_messages: int) -> list[SessionMessage]:
+    try:
+        f = open(jsonl_path, "rb")
+    except FileNotFoundError:
         return []
 
-    messages = []
-    count = 0
+    messages: list[SessionMessage] = []
+    add = messages.append
+    handlers = _MESSAGE_HANDLERS
 
-    with open(jsonl_path, "r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            if count >= max_messages:
+    with f:
+        for line in _iter_jsonl_lines(f):
+            if len(messages) >= max_messages:
                 break
-            line = line.strip()
-            if not line:
+            if len(line) < 2:
+                continue
+            if b'"type":"' in line and not any(m in line for m in _HANDLED_TYPE_MARKERS):
                 continue
             try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
+                data = _loads_line(line)
+            except ValueError:
                 continue
 
-            msg_type = data.get("type", "")
+            handler = handlers.get(data.get("type", ""))
+            if handler is None:
+                continue
             ts_str = data.get("timestamp")
             ts = None
             if ts_str:
@@ -312,242 +730,291 @@ def parse_session_transcript(jsonl_path: Path, max_messages: int = 500) -> list[
                     ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
                 except (ValueError, AttributeError):
                     pass
-
-            if msg_type == "user":
-                content = ""
-                msg_data = data.get("message", {})
-                if isinstance(msg_data, dict):
-                    parts = msg_data.get("content", "")
-                    if isinstance(parts, str):
-                        content = parts
-                    elif isinstance(parts, list):
-                        for part in parts:
-                            if isinstance(part, dict) and part.get("type") == "text":
-                                content += part.get("text", "")
-                            elif isinstance(part, str):
-                                content += part
-                clean = content.strip()
-                if clean and not clean.startswith("<command-"):
-                    messages.append(SessionMessage(
-                        role="user",
-                        content=clean,
-                        timestamp=ts,
-                        message_type="user",
-                    ))
-                    count += 1
-
-            elif msg_type == "assistant":
-                msg_data = data.get("message", {})
-                if isinstance(msg_data, dict):
-                    parts = msg_data.get("content", [])
-                    if isinstance(parts, list):
-                        for part in parts:
-                            if isinstance(part, dict):
-                                if part.get("type") == "text" and part.get("text", "").strip():
-                                    messages.append(SessionMessage(
-                                        role="assistant",
-                                        content=part["text"].strip(),
-                                        timestamp=ts,
-                                        message_type="text",
-                                    ))
-                                    count += 1
-                                elif part.get("type") == "thinking":
-                                    thinking = part.get("thinking", "").strip()
-                                    if thinking:
-                                        messages.append(SessionMessage(
-                                            role="system",
-                                            content=f"[Thinking] {thinking[:300]}",
-                                            timestamp=ts,
-                                            message_type="thinking",
-                                        ))
-                                        count += 1
-                                elif part.get("type") == "tool_use":
-                                    tool_name = part.get("name", "unknown")
-                                    tool_input = part.get("input", {})
-                                    summary = _summarize_tool_use(tool_name, tool_input)
-                                    messages.append(SessionMessage(
-                                        role="tool",
-                                        content=summary,
-                                        timestamp=ts,
-                                        tool_name=tool_name,
-                                        message_type="tool_use",
-                                    ))
-                                    count += 1
-                    elif isinstance(parts, str) and parts.strip():
-                        messages.append(SessionMessage(
-                            role="assistant",
-                            content=parts.strip(),
-                            timestamp=ts,
-                            message_type="text",
-                        ))
-                        count += 1
-
-            elif msg_type == "summary":
-                content = data.get("summary", "")
-                if content:
-                    messages.append(SessionMessage(
-                        role="system",
-                        content=f"[Summary] {content[:200]}",
-                        timestamp=ts,
-                        message_type="summary",
-                    ))
-                    count += 1
-
-            elif msg_type == "system":
-                subtype = data.get("subtype", "")
-                content = data.get("content", "")
-                if subtype and content:
-                    messages.append(SessionMessage(
-                        role="system",
-                        content=f"[{subtype}] {content[:150]}",
-                        timestamp=ts,
-                        message_type="system",
-                    ))
-                    count += 1
+            handler(data, ts, add)
 
     return messages
 
 
+# Per-type transcript handlers: each appends the messages one JSONL record
+# yields. Messages are built positionally, since keyword arguments roughly
+# double the cost of constructing the dataclass, and the usual record shape
+# is indexed directly: a malformed record falls out through the exception
+# instead of every record paying an isinstance() check at each level.
+
+def _user_messages(data: dict, ts: datetime | None, add) -> None:
+    content = ""
+    try:
+        parts = data["message"]["content"]
+    except (KeyError, TypeError):
+        parts = ""
+    if isinstance(parts, str):
+        content = parts
+    elif isinstance(parts, list):
+        for part in parts:
+            try:
+                if part.get("type") == "text":
+                    content += part.get("text", "")
+            except AttributeError:
+                if isinstance(part, str):
+                    content += part
+    # Command wrappers are dropped on the leading text alone, before the
+    # rstrip and clip that only kept messages need.
+    content = content.lstrip()
+    if content and not content.startswith("<command-"):
+        add(SessionMessage("user", _clip(content.rstrip()), ts, None, "user"))
+
+
+def _assistant_messages(data: dict, ts: datetime | None, add) -> None:
+    try:
+        parts = data["message"]["content"]
+    except (KeyError, TypeError):
+        return
+    if isinstance(parts, str):
+        if parts.strip():
+            add(SessionMessage("assistant", _clip(parts.strip()), ts, None, "text"))
+        return
+    if not isinstance(parts, list):
+        return
+    for part in parts:
+        try:
+            part_type = part.get("type")
+        except AttributeError:
+            continue
+        if part_type == "text":
+            text = part.get("text", "").strip()
+            if text:
+                add(SessionMessage("assistant", _clip(text), ts, None, "text"))
+        elif part_type == "thinking":
+            thinking = part.get("thinking", "").strip()
+            if thinking:
+                add(SessionMessage("system", f"[Thinking] {thinking[:300]}", ts, None, "thinking"))
+        elif part_type == "tool_use":
+            tool_name = sys.intern(str(part.get("name", "unknown")))
+            summary = _summarize_tool_use(tool_name, part.get("input", {}))
+            add(SessionMessage("tool", summary, ts, tool_name, "tool_use"))
+
+
+def _summary_messages(data: dict, ts: datetime | None, add) -> None:
+    content = data.get("summary", "")
+    if content:
+        add(SessionMessage("system", f"[Summary] {content[:200]}", ts, None, "summary"))
+
+
+def _system_messages(data: dict, ts: datetime | None, add) -> None:
+    subtype = data.get("subtype", "")
+    content = data.get("content", "")
+    if subtype and content:
+        add(SessionMessage("system", f"[{subtype}] {content[:150]}", ts, None, "system"))
+
+
+_MESSAGE_HANDLERS = {
+    "user": _user_messages,
+    "assistant": _assistant_messages,
+    "summary": _summary_messages,
+    "system": _system_messages,
+}
+
+# Claude Code writes compact JSON, so a record of a handled type contains one
+# of these verbatim. Lines with "type" keys but none of these (file-history
+# snapshots, queue operations, ...) are skipped without being decoded.
+# Most frequent first.
+_HANDLED_TYPE_MARKERS = tuple(
+    b'"type":"%s"' % t.encode() for t in ("assistant", "user", "system", "summary")
+)
+
+
+def _clip(text: str) -> str:
+    """Truncate oversized message bodies (pasted logs, tool dumps)."""
+    if len(text) > MAX_CONTENT_CHARS:
+        return text[:MAX_CONTENT_CHARS] + f"\n... [truncated {len(text) - MAX_CONTENT_CHARS:,} chars]"
+    return text
+
+
 def search_conversations(query: str, max_results: int = 50) -> list[dict]:
     """Deep search across all session transcripts."""
     query_lower = query.lower()
-    results = []
-    sessions = discover_all_sessions()
+    # Raw-line prefilter: an ASCII query that JSON would not escape appears
+    # verbatim in any line whose text matches, so misses skip decoding.
+    query_bytes = None
+    if query_lower.isascii() and query_lower.isprintable() and '"' not in query_lower and "\\" not in query_lower:
+        query_bytes = query_lower.encode()
+    # Sessions are searched concurrently to overlap their file reads;
+    # pool.map yields in session order, so results match a serial scan.
+    candidates = [s for s in discover_all_sessions() if s.jsonl_path and s.jsonl_size >= 100]
+    # Keyed on each transcript's current mtime and size, read now rather
+    # than from the cached session list, so any write since misses the memo
+    key = (query_lower, max_results, _fingerprint([s.jsonl_path for s in candidates]))
+    cached = cache.search_result(key)
+    if cached is not None:
+        return cached
 
-    for session in sessions:
-        if len(results) >= max_results:
-            break
-        if not session.jsonl_path or not session.jsonl_path.exists():
-            continue
-        # Only search sessions with data
-        if session.jsonl_size < 100:
-            continue
+    results = []
+    pool = ThreadPoolExecutor(max_workers=_IO_WORKERS)
+    try:
+        for found in pool.map(
+            lambda s: _search_session(s, query_lower, query_bytes, max_results), candidates
+        ):
+            results.extend(found)
+            if len(results) >= max_results:
+                break
+    finally:
+        pool.shutdown(cancel_futures=True)
 
-        try:
-            with open(session.jsonl_path, "r", encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    if len(results) >= max_results:
-                        break
-                    try:
-                        data = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
+    results = results[:max_results]
+    cache.store_search(key, results)
+    return results
 
-                    msg_type = data.get("type", "")
-                    text = ""
-
-                    if msg_type == "user":
-                        msg = data.get("message", {})
-                        if isinstance(msg, dict):
-                            c = msg.get("content", "")
-                            if isinstance(c, str):
-                                text = c
-                            elif isinstance(c, list):
-                                for p in c:
-                                    if isinstance(p, dict) and p.get("type") == "text":
-                                        text += p.get("text", "") + " "
-                                    elif isinstance(p, str):
-                                        text += p + " "
-                    elif msg_type == "assistant":
-                        msg = data.get("message", {})
-                        if isinstance(msg, dict):
-                            parts = msg.get("content", [])
-                            if isinstance(parts, list):
-                                for p in parts:
-                                    if isinstance(p, dict) and p.get("type") == "text":
-                                        text += p.get("text", "") + " "
-
-                    if query_lower in text.lower():
-                        # Extract snippet around match
-                        idx = text.lower().find(query_lower)
-                        start = max(0, idx - 40)
-                        end = min(len(text), idx + len(query) + 40)
-                        snippet = text[start:end].replace("\n", " ").strip()
-                        if start > 0:
-                            snippet = "..." + snippet
-                        if end < len(text):
-                            snippet += "..."
-
-                        results.append({
-                            "session": session,
-                            "role": "user" if msg_type == "user" else "assistant",
-                            "snippet": snippet,
-                            "timestamp": data.get("timestamp", ""),
-                        })
-        except OSError:
-            continue
 
+def _search_session(session: Session, query_lower: str, query_bytes: bytes | None, max_results: int) -> list[dict]:
+    """Return up to max_results matches from one session transcript."""
+    results = []
+    try:
+        with open(session.jsonl_path, "rb") as f:
+            if query_bytes is not None and not _file_mentions(f, query_bytes):
+                return results
+            for line in _iter_jsonl_lines(f):
+                if len(results) >= max_results:
+                    break
+                if len(line) < 2:
+                    continue
+                if query_bytes is not None and query_bytes not in line.lower():
+                    continue
+                try:
+                    data = _loads_line(line)
+                except ValueError:
+                    continue
+
+                msg_type = data.get("type", "")
+                extract = _SEARCH_TEXT.get(msg_type)
+                if extract is None:
+                    continue
+                msg = data.get("message", {})
+                text = extract(msg) if isinstance(msg, dict) else ""
+
+                idx = text.lower().find(query_lower)
+                if idx >= 0:
+                    # Extract snippet around match
+                    start = max(0, idx - 40)
+                    end = min(len(text), idx + len(query_lower) + 40)
+                    snippet = text[start:end].replace("\n", " ").strip()
+                    if start > 0:
+                        snippet = "..." + snippet
+                    if end < len(text):
+                        snippet += "..."
+
+                    results.append({
+                        "session": session,
+                        "role": "user" if msg_type == "user" else "assistant",
+                        "snippet": snippet,
+                        "timestamp": data.get("timestamp", ""),
+                    })
+    except OSError:
+        pass
     return results
 
 
-def export_conversation_markdown(session: Session) -> str:
-    """Export a session conversation as markdown."""
-    if not session.jsonl_path:
+def _file_mentions(f: BinaryIO, needle: bytes) -> bool:
+    """Whether a lowercased ASCII needle occurs anywhere in the file.
+
+    Scans a memory map in large lowercased windows, so a transcript without
+    the query is rejected in a few C-level passes instead of line by line.
+    """
+    size = os.fstat(f.fileno()).st_size
+    if size == 0:
+        return False
+    overlap = len(needle) - 1
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for start in range(0, size, _READ_CHUNK):
+            if needle in mm[start:start + _READ_CHUNK + overlap].lower():
+                return True
+    return False
+
+
+def _user_search_text(msg: dict) -> str:
+    c = msg.get("content", "")
+    if isinstance(c, str):
+        return c
+    if not isinstance(c, list):
         return ""
+    chunks = []
+    for p in c:
+        if isinstance(p, dict) and p.get("type") == "text":
+            chunks.append(p.get("text", ""))
+        elif isinstance(p, str):
+            chunks.append(p)
+    return " ".join(chunks) + " " if chunks else ""
+
+
+def _assistant_search_text(msg: dict) -> str:
+    parts = msg.get("content", [])
+    if not isinstance(parts, list):
+        return ""
+    chunks = [p.get("text", "") for p in parts if isinstance(p, dict) and p.get("type") == "text"]
+    return " ".join(chunks) + " " if chunks else ""
+
+
+# Only user and assistant records are searched; everything else (tool
+# results, summaries, system notes) is skipped before its content is touched.
+_SEARCH_TEXT = {
+    "user": _user_search_text,
+    "assistant": _assistant_search_text,
+}
+
+
+def export_conversation_markdown(session: Session, out: TextIO) -> None:
+    """Write a session conversation as markdown to an open text stream."""
+    if not session.jsonl_path:
+        return
 
     messages = parse_session_transcript(session.jsonl_path, max_messages=2000)
-    lines = [
-        f"# Conversation: {session.session_id}",
-        f"**Project:** {session.project_short}",
-        f"**Date:** {session.last_activity.strftime('%Y-%m-%d %H:%M') if session.last_activity else '?'}",
-        f"**Size:** {session.size_str}",
-        "",
-        "---",
-        "",
-    ]
+    w = out.write
+    w(
+        f"# Conversation: {session.session_id}\n"
+        f"**Project:** {session.project_short}\n"
+        f"**Date:** {session.last_activity.strftime('%Y-%m-%d %H:%M') if session.last_activity else '?'}\n"
+        f"**Size:** {session.size_str}\n"
+        "\n"
+        "---\n"
+    )
 
+    # Each block starts with its separator, as a "\n".join of all lines would
     for msg in messages:
         ts = msg.timestamp.strftime("%H:%M:%S") if msg.timestamp else ""
         if msg.role == "user":
-            lines.append(f"## You ({ts})")
-            lines.append("")
-            lines.append(msg.content)
-            lines.append("")
+            w(f"\n## You ({ts})\n\n{msg.content}\n")
         elif msg.role == "assistant":
-            lines.append(f"## Claude ({ts})")
-            lines.append("")
-            lines.append(msg.content)
-            lines.append("")
+            w(f"\n## Claude ({ts})\n\n{msg.content}\n")
         elif msg.role == "tool":
-            lines.append(f"> `{msg.content}`")
-            lines.append("")
+            w(f"\n> `{msg.content}`\n")
         elif msg.role == "system":
-            lines.append(f"> *{msg.content}*")
-            lines.append("")
+            w(f"\n> *{msg.content}*\n")
 
-    return "\n".join(lines)
+
+_TOOL_SUMMARIZERS = {
+    "Read": lambda i: f"Read {i.get('file_path', '?')}",
+    "Write": lambda i: f"Write {i.get('file_path', '?')}",
+    "Edit": lambda i: f"Edit {i.get('file_path', '?')}",
+    "Bash": lambda i: f"$ {i.get('command', '?')[:100]}",
+    "Glob": lambda i: f"Glob {i.get('pattern', '?')}",
+    "Grep": lambda i: f"Grep '{i.get('pattern', '?')}'",
+    "Task": lambda i: f"Task: {i.get('description', '?')}",
+    "WebSearch": lambda i: f"Search: {i.get('query', '?')}",
+}
 
 
 def _summarize_tool_use(tool_name: str, tool_input: dict) -> str:
     """Create a short summary of a tool use."""
-    if tool_name == "Read":
-        return f"Read {tool_input.get('file_path', '?')}"
-    elif tool_name == "Write":
-        return f"Write {tool_input.get('file_path', '?')}"
-    elif tool_name == "Edit":
-        return f"Edit {tool_input.get('file_path', '?')}"
-    elif tool_name == "Bash":
-        cmd = tool_input.get("command", "?")
-        return f"$ {cmd[:100]}"
-    elif tool_name == "Glob":
-        return f"Glob {tool_input.get('pattern', '?')}"
-    elif tool_name == "Grep":
-        return f"Grep '{tool_input.get('pattern', '?')}'"
-    elif tool_name == "Task":
-        return f"Task: {tool_input.get('description', '?')}"
-    elif tool_name == "WebSearch":
-        return f"Search: {tool_input.get('query', '?')}"
-    return f"{tool_name}()"
+    summarize = _TOOL_SUMMARIZERS.get(tool_name)
+    return summarize(tool_input) if summarize else f"{tool_name}()"
 
 
 def _load_stats_json() -> dict:
     """Load stats-cache.json once, return raw dict."""
-    stats_file = CLAUDE_DIR / "stats-cache.json"
-    if not stats_file.exists():
-        return {}
     try:
-        with open(stats_file, "r", encoding="utf-8", errors="replace") as f:
-            return json.load(f)
+        with open(CLAUDE_DIR / "stats-cache.json", "rb") as f:
+            return _loads_line(f.read())
+    except FileNotFoundError:
+        return {}
     except (json.JSONDecodeError, ValueError):
         return {}
 
@@ -565,9 +1032,29 @@ def _parse_model_usages(data: dict) -> list[ModelUsage]:
     return sorted(usages, key=lambda u: u.total_tokens, reverse=True)
 
 
-def _parse_hour_counts(data: dict) -> dict[int, int]:
-    raw = data.get("hourCounts", {})
-    return {int(h): int(c) for h, c in raw.items()}
+def _parse_hour_counts(data: dict) -> array[int]:
+    counts = array("I", [0] * 24)
+    for h, c in data.get("hourCounts", {}).items():
+        hour = int(h)
+        if 0 <= hour < 24:
+            counts[hour] = int(c)
+    return counts
+
+
+def _history_hour_counts(history: list[Prompt]) -> array[int]:
+    """Sessions started per local hour, for when stats-cache.json has none."""
+    # History is in file (time) order, so the first prompt seen starts the session
+    starts: dict[str, int] = {}
+    for p in history:
+        starts.setdefault(p.session_id, p.timestamp_ms)
+    counts = array("I", [0] * 24)
+    for ms in starts.values():
+        if ms:
+            try:
+                counts[time.localtime(ms / 1000).tm_hour] += 1
+            except (OverflowError, OSError, ValueError):
+                continue
+    return counts
 
 
 def _parse_longest_session(data: dict) -> dict:
@@ -575,11 +1062,11 @@ def _parse_longest_session(data: dict) -> dict:
 
 
 def _parse_claude_json_projects() -> list[ClaudeJsonProject]:
-    claude_json = Path.home() / ".claude.json"
+    claude_json = CLAUDE_JSON
     if not claude_json.exists():
         return []
     try:
-        data = json.loads(claude_json.read_text(encoding="utf-8", errors="replace"))
+        data = _loads(claude_json.read_text(encoding="utf-8", errors="replace"))
     except (json.JSONDecodeError, OSError):
         return []
 
@@ -613,7 +1100,7 @@ def _parse_todos() -> list[SessionTodos]:
             continue
         session_id, agent_id = parts[0], parts[1]
         try:
-            raw = json.loads(f.read_text(encoding="utf-8", errors="replace"))
+            raw = _loads(f.read_text(encoding="utf-8", errors="replace"))
         except (json.JSONDecodeError, OSError):
             continue
         if not isinstance(raw, list) or not raw:
@@ -643,7 +1130,7 @@ def _parse_settings() -> dict:
         return {}
     try:
         with open(settings_file, "r", encoding="utf-8", errors="replace") as f:
-            return json.load(f)
+            return _loads(f.read())
     except (json.JSONDecodeError, ValueError):
         return {}
 
@@ -662,12 +1149,12 @@ def parse_plans() -> list[Plan]:
             modified=datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc),
             size=stat.st_size,
         ))
-    return sorted(plans, key=lambda p: p.modified or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
+    return sorted(plans, key=lambda p: p.modified or DATETIME_MIN_UTC, reverse=True)
 
 
 def read_plan_content(plan: Plan) -> str:
     try:
-        return plan.path.read_text(encoding="utf-8", errors="replace")
+        return plan.path.read_bytes().decode("utf-8", errors="replace")
     except OSError:
         return "(Could not read plan)"
 
@@ -678,37 +1165,60 @@ def _parse_file_history() -> dict[str, list[str]]:
         return {}
 
     result = {}
-    for session_dir in fh_dir.iterdir():
-        if session_dir.is_dir():
-            files = []
-            for f in session_dir.rglob("*"):
-                if f.is_file():
-                    files.append(str(f.relative_to(session_dir)))
-            if files:
-                result[session_dir.name] = sorted(files)
+    with os.scandir(fh_dir) as it:
+        session_dirs = [e for e in it if e.is_dir()]
+    for session_dir in session_dirs:
+        # os.walk hands back plain names without building a Path or stat-ing
+        # each file. Every dirpath starts with the session dir, so its
+        # relative part is a plain slice.
+        files = []
+        root_len = len(session_dir.path) + 1
+        for dirpath, _dirnames, filenames in os.walk(session_dir.path):
+            rel = dirpath[root_len:]
+            if not rel:
+                files.extend(filenames)
+            else:
+                files.extend(os.path.join(rel, name) for name in filenames)
+        if files:
+            files.sort()
+            result[session_dir.name] = files
     return result
 
 
 def get_global_stats() -> GlobalStats:
     """Get aggregate stats for the dashboard."""
     stats = parse_stats()
-    history = parse_history()
+    history = parse_history_unsorted()
     projects = discover_projects()
     longest = parse_longest_session()
+    hour_counts = parse_hour_counts()
+    if not any(hour_counts):
+        hour_counts = _history_hour_counts(history)
+
+    total_messages = total_sessions = total_tools = 0
+    for s in stats:
+        total_messages += s.message_count
+        total_sessions += s.session_count
+        total_tools += s.tool_call_count
+    active_projects = total_bytes = 0
+    for p in projects:
+        total_bytes += p.total_size
+        if p.session_count > 0:
+            active_projects += 1
 
     return GlobalStats(
-        total_messages=sum(s.message_count for s in stats),
-        total_sessions=sum(s.session_count for s in stats),
-        total_tools=sum(s.tool_call_count for s in stats),
+        total_messages=total_messages,
+        total_sessions=total_sessions,
+        total_tools=total_tools,
         total_prompts=len(history),
-        total_projects=len([p for p in projects if p.session_count > 0]),
-        total_data_bytes=sum(p.total_size for p in projects),
+        total_projects=active_projects,
+        total_data_bytes=total_bytes,
         first_date=stats[0].date if stats else "?",
         last_date=stats[-1].date if stats else "?",
         active_days=len(stats),
         daily_stats=stats,
         model_usages=parse_model_usages(),
-        hour_counts=parse_hour_counts(),
+        hour_counts=hour_counts,
         longest_session_id=longest.get("sessionId", ""),
         longest_session_duration_ms=longest.get("duration", 0),
         longest_session_msgs=longest.get("messageCount", 0),
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+
 from textual.app import ComposeResult
 from textual.containers import Container
 from textual.widgets import Static, RichLog, Button, LoadingIndicator
@@ -12,6 +14,61 @@ from ..data.models import Session, SessionMessage, escape_markup
 from ..data.parsers import parse_session_transcript
 
 
+# Budget for cached message blocks, in characters of content plus markup.
+# Bodies run up to 100k chars each, so an entry count alone would not bound it.
+MAX_RENDERED_CHARS = 16_000_000
+
+
+class _RenderedBlocks:
+    """Least-recently-used cache of message markup, bounded by total size."""
+
+    __slots__ = ("_blocks", "_chars")
+
+    def __init__(self):
+        self._blocks: OrderedDict[tuple[str, str, str], str] = OrderedDict()
+        self._chars = 0
+
+    def get(self, key: tuple[str, str, str]) -> str:
+        block = self._blocks.get(key)
+        if block is not None:
+            self._blocks.move_to_end(key)
+            return block
+        block = _format_message(*key)
+        self._blocks[key] = block
+        self._chars += len(key[1]) + len(block)
+        while self._chars > MAX_RENDERED_CHARS:
+            (_, content, _), old = self._blocks.popitem(last=False)
+            self._chars -= len(content) + len(old)
+        return block
+
+
+_rendered = _RenderedBlocks()
+
+
+def _render_message(role: str, content: str, ts_str: str) -> str:
+    """Look the block up in _rendered, the size-bounded _RenderedBlocks cache.
+
+    On a miss it is built with _format_message and stored, so reopening a
+    session skips the escaping.
+    """
+    return _rendered.get((role, content, ts_str))
+
+
+def _format_message(role: str, content: str, ts_str: str) -> str:
+    """Markup for one message as a single block, written with one RichLog call."""
+    if role == "user":
+        body = "\n".join(f"  [#cdd6f4]{escape_markup(line)}[/]" for line in content.split("\n"))
+        return f"{ts_str}[bold #89b4fa]YOU:[/]\n{body}\n"
+    if role == "assistant":
+        body = "\n".join(f"  [#bac2de]{escape_markup(line)}[/]" for line in content.split("\n"))
+        return f"{ts_str}[bold #a6e3a1]CLAUDE:[/]\n{body}\n"
+    if role == "tool":
+        return f"  {ts_str}[#cba6f7]{escape_markup(content)}[/]"
+    if role == "system":
+        return f"  {ts_str}[#f9e2af]{escape_markup(content)}[/]\n"
+    return ""
+
+
 class ExportRequested(Message):
     def __init__(self, session: Session) -> None:
         super().__init__()
@@ -110,22 +167,9 @@ class ConversationScreen(Container):
             ts_str = ""
             if msg.timestamp:
                 ts_str = f"[#585b70]{msg.timestamp.strftime('%H:%M:%S')}[/] "
-
-            if msg.role == "user":
-                log.write(f"{ts_str}[bold #89b4fa]YOU:[/]")
-                for line in msg.content.split("\n"):
-                    log.write(f"  [#cdd6f4]{escape_markup(line)}[/]")
-                log.write("")
-            elif msg.role == "assistant":
-                log.write(f"{ts_str}[bold #a6e3a1]CLAUDE:[/]")
-                for line in msg.content.split("\n"):
-                    log.write(f"  [#bac2de]{escape_markup(line)}[/]")
-                log.write("")
-            elif msg.role == "tool":
-                log.write(f"  {ts_str}[#cba6f7]{escape_markup(msg.content)}[/]")
-            elif msg.role == "system":
-                log.write(f"  {ts_str}[#f9e2af]{escape_markup(msg.content)}[/]")
-                log.write("")
+            block = _render_message(msg.role, msg.content, ts_str)
+            if block:
+                log.write(block)
 
     def _show_error(self, message: str) -> None:
         self.query_one("#conv-loading").display = False
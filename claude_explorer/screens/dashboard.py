@@ -2,35 +2,42 @@
 
 from __future__ import annotations
 
+import heapq
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
-from textual.widgets import Static
+from textual.widgets import LoadingIndicator, Static
+from textual.worker import Worker, WorkerState
 
 from ..data.parsers import get_global_stats
-from ..data.models import format_size
+from ..data.models import GlobalStats, escape_markup, format_size
 
 
 SPARKLINE_CHARS = " ▁▂▃▄▅▆▇█"
 HOUR_LABELS = [f"{h:02d}" for h in range(24)]
+STAT_LABELS = (
+    "Total Messages", "Total Sessions", "Tool Calls",
+    "User Prompts", "Projects", "Active Days",
+)
 
 
 def make_sparkline(values: list[int], width: int = 60) -> str:
     if not values:
         return ""
-    if len(values) > width:
-        step = len(values) / width
-        sampled = [values[int(i * step)] for i in range(width)]
+    n = len(values)
+    if n > width:
+        sampled = [values[i * n // width] for i in range(width)]
     else:
         sampled = values
 
-    max_val = max(sampled) if sampled else 1
-    if max_val == 0:
+    max_val = max(sampled)
+    if max_val <= 0:
         return SPARKLINE_CHARS[0] * len(sampled)
 
-    return "".join(
-        SPARKLINE_CHARS[min(int(v / max_val * 8), 8)]
-        for v in sampled
-    )
+    # Integer math throughout: exact, no per-value float division, and
+    # v <= max_val keeps every level within 0..8
+    chars = SPARKLINE_CHARS
+    return "".join([chars[v * 8 // max_val] for v in sampled])
 
 
 def format_number(n: int) -> str:
@@ -59,41 +66,81 @@ class StatBox(Static):
         self.value = value
 
     def compose(self) -> ComposeResult:
-        yield Static(f"[bold #cba6f7]{self.value}[/]", markup=True)
+        yield Static(f"[bold #cba6f7]{self.value}[/]", markup=True, classes="stat-value")
         yield Static(f"[#a6adc8]{self.label}[/]", markup=True)
 
+    def set_value(self, value: str) -> None:
+        if value != self.value:
+            self.value = value
+            self.query_one(".stat-value", Static).update(f"[bold #cba6f7]{value}[/]")
+
 
 class DashboardScreen(Container):
     """Main dashboard with stats overview."""
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._load_worker: Worker | None = None
+        # Mounted on first render, then updated in place on reload
+        self._stat_boxes: list[StatBox] = []
+        self._chart: Static | None = None
+        self._info: Static | None = None
+
     def compose(self) -> ComposeResult:
         yield Static(
             "[bold #cba6f7]  CLAUDE EXPLORER[/] [#a6adc8]- Your .claude at a glance[/]",
             markup=True,
             id="dashboard-title",
         )
+        yield LoadingIndicator(id="dashboard-loading")
         yield Container(id="dashboard-content")
 
     def on_mount(self) -> None:
         self.load_dashboard()
 
     def load_dashboard(self) -> None:
-        container = self.query_one("#dashboard-content")
-        container.remove_children()
+        # Parsing history/projects on a cold cache can take seconds;
+        # do it off the event loop so the UI stays interactive.
+        if self._load_worker and self._load_worker.state == WorkerState.RUNNING:
+            self._load_worker.cancel()
+
+        self.query_one("#dashboard-loading").display = True
+        self._load_worker = self.run_worker(
+            get_global_stats,
+            thread=True,
+            name="load_dashboard",
+            exit_on_error=False,
+        )
 
-        gs = get_global_stats()
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        if event.worker is not self._load_worker:
+            return
+
+        if event.state == WorkerState.SUCCESS:
+            self.query_one("#dashboard-loading").display = False
+            self._render_dashboard(event.worker.result)
+        elif event.state == WorkerState.ERROR:
+            self.query_one("#dashboard-loading").display = False
+            container = self.query_one("#dashboard-content")
+            container.remove_children()
+            self._stat_boxes = []
+            self._chart = self._info = None
+            container.mount(Static(
+                f"[#f38ba8]Failed to load stats: {escape_markup(str(event.worker.error))}[/]",
+                markup=True,
+            ))
+
+    def _render_dashboard(self, gs: GlobalStats) -> None:
         daily = gs.daily_stats
 
-        stats_row = Horizontal(
-            StatBox("Total Messages", format_number(gs.total_messages), classes="stat-box"),
-            StatBox("Total Sessions", format_number(gs.total_sessions), classes="stat-box"),
-            StatBox("Tool Calls", format_number(gs.total_tools), classes="stat-box"),
-            StatBox("User Prompts", format_number(gs.total_prompts), classes="stat-box"),
-            StatBox("Projects", str(gs.total_projects), classes="stat-box"),
-            StatBox("Active Days", str(gs.active_days), classes="stat-box"),
+        stat_values = (
+            format_number(gs.total_messages),
+            format_number(gs.total_sessions),
+            format_number(gs.total_tools),
+            format_number(gs.total_prompts),
+            str(gs.total_projects),
+            str(gs.active_days),
         )
-        stats_row.styles.height = 5
-        stats_row.styles.dock = "top"
 
         msg_values = [d.message_count for d in daily]
         tool_values = [d.tool_call_count for d in daily]
@@ -108,35 +155,33 @@ class DashboardScreen(Container):
         lines.append("")
 
         if daily:
-            max_msg = max(d.message_count for d in daily)
-            top_days = sorted(daily, key=lambda d: d.message_count, reverse=True)[:5]
+            # Bars are scaled against the busiest day; a zero max draws no bars
+            max_msg = max(msg_values) or 1
+            top_days = heapq.nlargest(5, daily, key=lambda d: d.message_count)
             lines.append("[bold #cba6f7]Most Active Days:[/]")
             for d in top_days:
-                bar_len = int(d.message_count / max_msg * 30) if max_msg else 0
+                bar_len = d.message_count * 30 // max_msg
                 bar = "[#89b4fa]" + "█" * bar_len + "[/]"
                 lines.append(f"  {d.date}  {bar} {d.message_count} msgs, {d.tool_call_count} tools")
 
             lines.append("")
             lines.append("[bold #cba6f7]Recent Activity:[/]")
             for d in daily[-7:]:
-                bar_len = int(d.message_count / max_msg * 30) if max_msg else 0
+                bar_len = d.message_count * 30 // max_msg
                 bar = "[#a6e3a1]" + "█" * bar_len + "[/]"
                 lines.append(f"  {d.date}  {bar} {d.message_count} msgs")
 
         # Hourly activity heatmap
-        if gs.hour_counts:
+        hour_counts = gs.hour_counts
+        if any(hour_counts):
             lines.append("")
             lines.append("[bold #cba6f7]Activity by Hour:[/]")
-            max_h = max(gs.hour_counts.values()) if gs.hour_counts else 1
-            heatmap = ""
-            for h in range(24):
-                count = gs.hour_counts.get(h, 0)
-                intensity = int(count / max_h * 8) if max_h else 0
-                char = SPARKLINE_CHARS[intensity]
-                heatmap += f"[#cba6f7]{char}[/]"
-            lines.append(f"  00h {''.join(heatmap)} 23h")
-            peak_hour = max(gs.hour_counts, key=gs.hour_counts.get)
-            lines.append(f"  Peak: [#f9e2af]{peak_hour:02d}h[/] ({gs.hour_counts[peak_hour]} sessions)")
+            max_h = max(hour_counts)
+            # Same 0..8 levels as the sparklines, under one markup tag
+            heatmap = make_sparkline(hour_counts, width=24)
+            lines.append(f"  00h [#cba6f7]{heatmap}[/] 23h")
+            peak_hour = hour_counts.index(max_h)
+            lines.append(f"  Peak: [#f9e2af]{peak_hour:02d}h[/] ({max_h} sessions)")
 
         # Model usage breakdown
         if gs.model_usages:
@@ -162,16 +207,32 @@ class DashboardScreen(Container):
                 f"[#a6adc8]{gs.longest_session_msgs} msgs | {gs.longest_session_id[:10]}...[/]"
             )
 
-        chart = Static("\n".join(lines), markup=True, id="activity-chart")
+        chart_text = "\n".join(lines)
 
         data_mb = gs.total_data_bytes / 1024 / 1024
-        info = Static(
+        info_text = (
             f"\n[#a6adc8]Data range: {gs.first_date} to {gs.last_date} | "
             f"Total session data: {data_mb:.1f}MB | "
-            f"History prompts: {gs.total_prompts}[/]",
-            markup=True,
+            f"History prompts: {gs.total_prompts}[/]"
         )
 
-        container.mount(stats_row)
-        container.mount(chart)
-        container.mount(info)
+        if self._chart is not None:
+            # A reload only changes text; keep the widgets rather than rebuilding them
+            for box, value in zip(self._stat_boxes, stat_values):
+                box.set_value(value)
+            self._chart.update(chart_text)
+            self._info.update(info_text)
+            return
+
+        container = self.query_one("#dashboard-content")
+        container.remove_children()
+        self._stat_boxes = [
+            StatBox(label, value, classes="stat-box")
+            for label, value in zip(STAT_LABELS, stat_values)
+        ]
+        stats_row = Horizontal(*self._stat_boxes)
+        stats_row.styles.height = 5
+        stats_row.styles.dock = "top"
+        self._chart = Static(chart_text, markup=True, id="activity-chart")
+        self._info = Static(info_text, markup=True)
+        container.mount(stats_row, self._chart, self._info)
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+from operator import itemgetter
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
 from textual.widgets import DataTable, Static, RichLog
 
 from ..data.parsers import parse_file_history, discover_all_sessions
-from ..data.models import Session, escape_markup
+from ..data.models import DATETIME_MIN_UTC, Session, escape_markup
+
+# File list color per extension
+EXT_COLOR = {
+    ".ts": "#f9e2af", ".tsx": "#f9e2af", ".js": "#f9e2af", ".jsx": "#f9e2af",
+    ".py": "#89b4fa",
+    ".md": "#a6e3a1", ".txt": "#a6e3a1",
+    ".json": "#cba6f7", ".yaml": "#cba6f7", ".yml": "#cba6f7", ".toml": "#cba6f7",
+    ".css": "#f38ba8", ".scss": "#f38ba8", ".tcss": "#f38ba8",
+}
+DEFAULT_COLOR = "#cdd6f4"
 
 
 class FileHistoryScreen(Container):
@@ -36,26 +48,30 @@ class FileHistoryScreen(Container):
         self._sessions_map = {s.session_id: s for s in sessions}
 
         table = self.query_one("#fh-sessions-table", DataTable)
-        table.clear(columns=True)
-        table.cursor_type = "row"
-        table.add_columns("Date", "Project", "Files Changed")
-        table.styles.width = 50
+        table.clear()
+        if not table.columns:
+            table.cursor_type = "row"
+            table.add_columns("Date", "Project", "Files Changed")
+            table.styles.width = 50
 
         # Sort sessions by date, only show those with file history
         entries = []
         for sid, files in self._fh.items():
             session = self._sessions_map.get(sid)
+            sort_dt = DATETIME_MIN_UTC
             date_str = "?"
             project = sid[:10] + "..."
             if session:
                 if session.last_activity:
-                    date_str = session.last_activity.strftime("%Y-%m-%d %H:%M")
+                    sort_dt = session.last_activity
+                    date_str = sort_dt.strftime("%Y-%m-%d %H:%M")
                 project = session.project_short
-            entries.append((date_str, project, len(files), sid))
+            entries.append((sort_dt, date_str, project, len(files), sid))
 
-        entries.sort(key=lambda x: x[0], reverse=True)
+        # Undated sessions sort last rather than by the "?" placeholder
+        entries.sort(key=itemgetter(0), reverse=True)
 
-        for date_str, project, file_count, sid in entries:
+        for _, date_str, project, file_count, sid in entries:
             table.add_row(date_str, project, str(file_count), key=sid)
 
         # Show summary
@@ -83,24 +99,18 @@ class FileHistoryScreen(Container):
         project = session.project_short if session else sid[:10]
         date_str = session.last_activity.strftime("%Y-%m-%d %H:%M") if session and session.last_activity else "?"
 
-        log.write(f"[bold #cba6f7]Files changed in session[/]")
-        log.write(f"[#a6adc8]Project: {project} | Date: {date_str}[/]")
-        log.write(f"[#a6adc8]{len(files)} files[/]")
-        log.write("[#45475a]" + "─" * 60 + "[/]")
-        log.write("")
-
+        lines = [
+            "[bold #cba6f7]Files changed in session[/]",
+            f"[#a6adc8]Project: {project} | Date: {date_str}[/]",
+            f"[#a6adc8]{len(files)} files[/]",
+            "[#45475a]" + "─" * 60 + "[/]",
+            "",
+        ]
         for f in files:
-            # Color by extension
-            if f.endswith((".ts", ".tsx", ".js", ".jsx")):
-                color = "#f9e2af"
-            elif f.endswith((".py",)):
-                color = "#89b4fa"
-            elif f.endswith((".md", ".txt")):
-                color = "#a6e3a1"
-            elif f.endswith((".json", ".yaml", ".yml", ".toml")):
-                color = "#cba6f7"
-            elif f.endswith((".css", ".scss", ".tcss")):
-                color = "#f38ba8"
-            else:
-                color = "#cdd6f4"
-            log.write(f"  [{color}]{escape_markup(f)}[/]")
+            # rpartition, not splitext: no path normalization, and a dotfile
+            # like ".md" keeps its color as it did with endswith
+            _, dot, ext = f.rpartition(".")
+            color = EXT_COLOR.get(dot + ext, DEFAULT_COLOR)
+            lines.append(f"  [{color}]{escape_markup(f)}[/]")
+        # One write: a session can touch hundreds of files
+        log.write("\n".join(lines))
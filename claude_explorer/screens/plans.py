@@ -16,6 +16,7 @@ class PlansScreen(Container):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._plans: list[Plan] = []
+        self._plans_by_name: dict[str, Plan] = {}
 
     def compose(self) -> ComposeResult:
         yield Static(
@@ -31,12 +32,14 @@ class PlansScreen(Container):
 
     def load_plans(self) -> None:
         table = self.query_one("#plans-table", DataTable)
-        table.clear(columns=True)
-        table.cursor_type = "row"
-        table.add_columns("Plan", "Date", "Size")
-        table.styles.width = 40
+        table.clear()
+        if not table.columns:
+            table.cursor_type = "row"
+            table.add_columns("Plan", "Date", "Size")
+            table.styles.width = 40
 
         self._plans = parse_plans()
+        self._plans_by_name = {p.name: p for p in self._plans}
 
         for plan in self._plans:
             date_str = plan.modified.strftime("%Y-%m-%d") if plan.modified else "?"
@@ -49,7 +52,7 @@ class PlansScreen(Container):
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         row_key = event.row_key
         if row_key:
-            plan = next((p for p in self._plans if p.name == row_key.value), None)
+            plan = self._plans_by_name.get(row_key.value)
             if plan:
                 self._show_plan(plan)
 
@@ -35,9 +35,10 @@ class ProjectsScreen(Container):
 
     def load_projects(self) -> None:
         table = self.query_one("#projects-table", DataTable)
-        table.clear(columns=True)
-        table.cursor_type = "row"
-        table.add_columns("Project", "Sessions", "Total Size", "Latest Session")
+        table.clear()
+        if not table.columns:
+            table.cursor_type = "row"
+            table.add_columns("Project", "Sessions", "Total Size", "Latest Session")
         self._projects_map = {}
 
         projects = discover_projects()
@@ -10,7 +10,7 @@ from textual.timer import Timer
 from textual.worker import Worker, WorkerState
 
 from ..data.parsers import parse_history, search_conversations, discover_all_sessions
-from ..data.models import Prompt, Session
+from ..data.models import Prompt, Session, escape_markup
 
 
 class SearchSessionSelected(Message):
@@ -25,12 +25,21 @@ class SearchScreen(Container):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._prompts: list[Prompt] = []
+        self._prompts_folded: list[str] = []  # casefolded text, parallel to _prompts
+        # Last prompt query (casefolded) and every (prompt, folded text) it matched
+        self._last_query = ""
+        self._matches: list[tuple[Prompt, str]] = []
         self._loaded = False
+        self._history_worker: Worker | None = None
+        self._pending_query: str | None = None  # prompt search waiting on the history load
         self._deep_results: list[dict] = []
         self._prompt_results: list[Prompt] = []
         self._deep_mode = False
         self._debounce_timer: Timer | None = None
         self._search_worker: Worker | None = None
+        # Built from the cached session list; rebuilt when a refresh replaces it
+        self._sessions_src: list[Session] | None = None
+        self._sessions_by_id: dict[str, Session] = {}
 
     def compose(self) -> ComposeResult:
         yield Static(
@@ -56,18 +65,30 @@ class SearchScreen(Container):
         label.styles.padding = (1, 0)
         sw = self.query_one("#deep-switch")
         sw.styles.width = 10
+        # History can take a while to parse on a cold cache; load it before
+        # the first keystroke, off the event loop
+        self._history_worker = self.run_worker(
+            self._load_history,
+            thread=True,
+            name="load_search_history",
+            exit_on_error=False,
+        )
 
     def on_unmount(self) -> None:
+        self._cancel_debounce()
+        if self._search_worker and self._search_worker.state == WorkerState.RUNNING:
+            self._search_worker.cancel()
+
+    def _cancel_debounce(self) -> None:
         if self._debounce_timer:
             self._debounce_timer.stop()
             self._debounce_timer = None
-        if self._search_worker and self._search_worker.state == WorkerState.RUNNING:
-            self._search_worker.cancel()
 
-    def _ensure_loaded(self) -> None:
-        if not self._loaded:
-            self._prompts = parse_history()
-            self._loaded = True
+    @staticmethod
+    def _load_history() -> tuple[list[Prompt], list[str]]:
+        prompts = parse_history()
+        # Case-folded once here rather than for every prompt on every search
+        return prompts, [p.text.casefold() for p in prompts]
 
     def on_switch_changed(self, event: Switch.Changed) -> None:
         if event.switch.id == "deep-switch":
@@ -85,7 +106,10 @@ class SearchScreen(Container):
         if event.input.id != "search-input":
             return
         query = event.value.strip()
+        # Whatever happens next supersedes a search still waiting to run
+        self._cancel_debounce()
         if len(query) < 3:
+            self._pending_query = None
             table = self.query_one("#search-results-table", DataTable)
             table.clear()
             self._deep_results = []
@@ -99,9 +123,7 @@ class SearchScreen(Container):
             status = self.query_one("#search-status", Static)
             status.update("[#f9e2af]Press Enter to search conversations...[/]")
         else:
-            # Debounce: cancel previous timer, start new 300ms delay
-            if self._debounce_timer:
-                self._debounce_timer.stop()
+            # Debounce: run once typing pauses for 300ms
             self._debounce_timer = self.set_timer(0.3, lambda: self._do_search(query))
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
@@ -110,6 +132,7 @@ class SearchScreen(Container):
             return
         query = event.value.strip()
         if len(query) >= 3:
+            self._cancel_debounce()
             self._do_search(query)
 
     def _do_search(self, query: str) -> None:
@@ -129,18 +152,29 @@ class SearchScreen(Container):
                 lambda: search_conversations(query, max_results=100),
                 thread=True,
             )
+        elif not self._loaded:
+            # Runs from on_worker_state_changed once history is in
+            self._pending_query = query
+            status.update("[#a6adc8]Loading prompt history...[/]")
         else:
-            self._ensure_loaded()
-            results = [p for p in self._prompts if query.lower() in p.text.lower()]
-            self._prompt_results = results[:100]
+            q = query.casefold()
+            # Anything matching a longer query also matched one it contains,
+            # so typing further only rescans the previous matches
+            if self._last_query and self._last_query in q:
+                candidates = self._matches
+            else:
+                candidates = zip(self._prompts, self._prompts_folded)
+            self._matches = [m for m in candidates if q in m[1]]
+            self._last_query = q
+            self._prompt_results = [p for p, _ in self._matches[:100]]
 
             for i, p in enumerate(self._prompt_results):
                 date_str = p.timestamp.strftime("%Y-%m-%d %H:%M")
                 text_preview = p.text[:120].replace("\n", " ").strip()
                 table.add_row(date_str, p.project_short, "you", text_preview, key=f"p{i}")
 
-            count = len(results)
-            shown = min(count, 100)
+            count = len(self._matches)
+            shown = len(self._prompt_results)
             status.update(
                 f"[#a6e3a1]{count} results[/] [#a6adc8](showing {shown})[/]"
                 if count > 0
@@ -148,7 +182,10 @@ class SearchScreen(Container):
             )
 
     def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
-        """Handle deep search worker completion."""
+        """Handle history load and deep search worker completion."""
+        if event.worker is self._history_worker:
+            self._on_history_loaded(event)
+            return
         if event.worker is not self._search_worker:
             return
         if event.state != WorkerState.SUCCESS:
@@ -182,6 +219,18 @@ class SearchScreen(Container):
             else "[#f38ba8]No matches in conversations[/]"
         )
 
+    def _on_history_loaded(self, event: Worker.StateChanged) -> None:
+        if event.state == WorkerState.SUCCESS:
+            self._prompts, self._prompts_folded = event.worker.result
+            self._loaded = True
+            query, self._pending_query = self._pending_query, None
+            if query and not self._deep_mode:
+                self._do_search(query)
+        elif event.state == WorkerState.ERROR:
+            self._pending_query = None
+            status = self.query_one("#search-status", Static)
+            status.update(f"[#f38ba8]Failed to load history: {escape_markup(str(event.worker.error))}[/]")
+
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Open conversation when clicking a search result."""
         row_key = event.row_key
@@ -200,9 +249,9 @@ class SearchScreen(Container):
             if idx < len(self._prompt_results):
                 prompt = self._prompt_results[idx]
                 sessions = discover_all_sessions()
-                session = next(
-                    (s for s in sessions if s.session_id == prompt.session_id),
-                    None,
-                )
+                if sessions is not self._sessions_src:
+                    self._sessions_src = sessions
+                    self._sessions_by_id = {s.session_id: s for s in sessions}
+                session = self._sessions_by_id.get(prompt.session_id)
                 if session:
                     self.post_message(SearchSessionSelected(session))
@@ -10,6 +10,9 @@ from textual.message import Message
 from ..data.parsers import discover_all_sessions
 from ..data.models import Session
 
+# Rows put in the table at once; the filter narrows down the rest
+MAX_ROWS = 500
+
 
 class SessionSelected(Message):
     def __init__(self, session: Session) -> None:
@@ -23,7 +26,12 @@ class SessionsScreen(Container):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._sessions: list[Session] = []
+        self._sessions_by_id: dict[str, Session] = {}
         self._filtered: list[Session] = []
+        # (session, lowered filter key) for every session, and for the current matches
+        self._filter_keys: list[tuple[Session, str]] = []
+        self._matches: list[tuple[Session, str]] = []
+        self._last_query = ""  # filter _matches was built from
 
     def compose(self) -> ComposeResult:
         yield Static(
@@ -32,18 +40,30 @@ class SessionsScreen(Container):
         )
         yield Input(placeholder="Filter by project, date, or session ID...", id="session-filter")
         yield DataTable(id="sessions-table")
+        yield Static("", markup=True, id="sessions-count")
 
     def on_mount(self) -> None:
         self.load_sessions()
 
     def load_sessions(self) -> None:
         table = self.query_one("#sessions-table", DataTable)
-        table.clear(columns=True)
-        table.cursor_type = "row"
-        table.add_columns("Date", "Project", "Session ID", "Size", "Prompts", "Duration")
+        table.clear()
+        if not table.columns:
+            table.cursor_type = "row"
+            table.add_columns("Date", "Project", "Session ID", "Size", "Prompts", "Duration")
 
         self._sessions = discover_all_sessions()
+        self._sessions_by_id = {s.session_id: s for s in self._sessions}
+        # Everything the filter matches, lowered once; NUL separators keep a
+        # query from matching across two fields
+        self._filter_keys = [
+            (s, f"{s.project_short.lower()}\0{s.session_id.lower()}\0"
+                f"{s.date_str[:10] if s.last_activity else ''}")
+            for s in self._sessions
+        ]
+        self._matches = self._filter_keys
         self._filtered = self._sessions[:]
+        self._last_query = ""
         self._populate_table()
 
     def filter_by_project(self, project_name: str) -> None:
@@ -55,10 +75,9 @@ class SessionsScreen(Container):
     def _populate_table(self) -> None:
         table = self.query_one("#sessions-table", DataTable)
         table.clear()
-        for s in self._filtered:
-            date_str = s.last_activity.strftime("%Y-%m-%d %H:%M") if s.last_activity else "?"
+        for s in self._filtered[:MAX_ROWS]:
             table.add_row(
-                date_str,
+                s.date_str,
                 s.project_short or s.project,
                 s.session_id[:10] + "...",
                 s.size_str,
@@ -67,23 +86,35 @@ class SessionsScreen(Container):
                 key=s.session_id,
             )
 
+        count = self.query_one("#sessions-count", Static)
+        total = len(self._filtered)
+        count.display = total > MAX_ROWS
+        if total > MAX_ROWS:
+            count.update(
+                f"[#a6adc8]Showing {MAX_ROWS} of {total} sessions - refine the filter to see more[/]"
+            )
+
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "session-filter":
             query = event.value.lower().strip()
             if not query:
+                self._matches = self._filter_keys
                 self._filtered = self._sessions[:]
             else:
-                self._filtered = [
-                    s for s in self._sessions
-                    if query in s.project_short.lower()
-                    or query in s.session_id.lower()
-                    or (s.last_activity and query in s.last_activity.strftime("%Y-%m-%d"))
-                ]
+                # A query containing the previous one can only drop rows,
+                # so typing further rescans just the current matches
+                if self._last_query and self._last_query in query:
+                    candidates = self._matches
+                else:
+                    candidates = self._filter_keys
+                self._matches = [m for m in candidates if query in m[1]]
+                self._filtered = [s for s, _ in self._matches]
+            self._last_query = query
             self._populate_table()
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         row_key = event.row_key
         if row_key:
-            session = next((s for s in self._sessions if s.session_id == row_key.value), None)
+            session = self._sessions_by_id.get(row_key.value)
             if session:
                 self.post_message(SessionSelected(session))
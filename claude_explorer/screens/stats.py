@@ -9,11 +9,14 @@ from textual.widgets import DataTable, Static, RichLog
 from ..data.parsers import parse_stats
 
 
-def make_bar(value: int, max_value: int, width: int = 30) -> str:
-    if max_value == 0:
-        return ""
-    filled = int(value / max_value * width)
-    return "█" * filled + "░" * (width - filled)
+CHART_WIDTH = 40
+# Every bar the charts can draw, indexed by filled cells
+BARS = tuple("█" * i + "░" * (CHART_WIDTH - i) for i in range(CHART_WIDTH + 1))
+
+
+def _chart_bar(value: int, max_value: int) -> str:
+    """A CHART_WIDTH-cell bar for value out of max_value; empty when max is 0."""
+    return BARS[value * CHART_WIDTH // max_value] if max_value else ""
 
 
 class StatsScreen(Container):
@@ -41,51 +44,62 @@ class StatsScreen(Container):
             chart.write("[#f38ba8]No stats data found.[/]")
             return
 
-        max_msgs = max(s.message_count for s in stats)
-        max_tools = max(s.tool_call_count for s in stats)
-
-        chart.write("[bold #cba6f7]Messages per Day[/]")
-        chart.write("")
+        # Totals and maxima in one pass over the days
+        total_msgs = total_tools = total_sessions = 0
+        max_msgs = max_tools = 0
+        for s in stats:
+            m, t = s.message_count, s.tool_call_count
+            total_msgs += m
+            total_tools += t
+            total_sessions += s.session_count
+            if m > max_msgs:
+                max_msgs = m
+            if t > max_tools:
+                max_tools = t
+
+        lines = []
+        lines.append("[bold #cba6f7]Messages per Day[/]")
+        lines.append("")
 
         recent = stats[-20:]
         for day in recent:
-            bar = make_bar(day.message_count, max_msgs, 40)
-            chart.write(f"  {day.date}  [#89b4fa]{bar}[/] {day.message_count}")
+            bar = _chart_bar(day.message_count, max_msgs)
+            lines.append(f"  {day.date}  [#89b4fa]{bar}[/] {day.message_count}")
 
-        chart.write("")
-        chart.write("[bold #cba6f7]Tool Calls per Day[/]")
-        chart.write("")
+        lines.append("")
+        lines.append("[bold #cba6f7]Tool Calls per Day[/]")
+        lines.append("")
 
         for day in recent:
-            bar = make_bar(day.tool_call_count, max_tools, 40)
-            chart.write(f"  {day.date}  [#a6e3a1]{bar}[/] {day.tool_call_count}")
-
-        total_msgs = sum(s.message_count for s in stats)
-        total_tools = sum(s.tool_call_count for s in stats)
-        total_sessions = sum(s.session_count for s in stats)
-        avg_msgs = total_msgs // len(stats) if stats else 0
-        avg_tools = total_tools // len(stats) if stats else 0
-
-        chart.write("")
-        chart.write("[bold #cba6f7]Summary:[/]")
-        chart.write(f"  Total messages:   [bold]{total_msgs:,}[/]")
-        chart.write(f"  Total tool calls: [bold]{total_tools:,}[/]")
-        chart.write(f"  Total sessions:   [bold]{total_sessions:,}[/]")
-        chart.write(f"  Avg msgs/day:     [bold]{avg_msgs:,}[/]")
-        chart.write(f"  Avg tools/day:    [bold]{avg_tools:,}[/]")
-        chart.write(f"  Active days:      [bold]{len(stats)}[/]")
+            bar = _chart_bar(day.tool_call_count, max_tools)
+            lines.append(f"  {day.date}  [#a6e3a1]{bar}[/] {day.tool_call_count}")
+
+        avg_msgs = total_msgs // len(stats)
+        avg_tools = total_tools // len(stats)
+
+        lines.append("")
+        lines.append("[bold #cba6f7]Summary:[/]")
+        lines.append(f"  Total messages:   [bold]{total_msgs:,}[/]")
+        lines.append(f"  Total tool calls: [bold]{total_tools:,}[/]")
+        lines.append(f"  Total sessions:   [bold]{total_sessions:,}[/]")
+        lines.append(f"  Avg msgs/day:     [bold]{avg_msgs:,}[/]")
+        lines.append(f"  Avg tools/day:    [bold]{avg_tools:,}[/]")
+        lines.append(f"  Active days:      [bold]{len(stats)}[/]")
+        chart.write("\n".join(lines))
 
         table = self.query_one("#stats-detail-table", DataTable)
-        table.clear(columns=True)
-        table.cursor_type = "row"
-        table.add_columns("Date", "Messages", "Sessions", "Tool Calls", "Msgs/Session")
+        table.clear()
+        if not table.columns:
+            table.cursor_type = "row"
+            table.add_columns("Date", "Messages", "Sessions", "Tool Calls", "Msgs/Session")
 
-        for day in reversed(stats):
-            msgs_per_session = day.message_count // day.session_count if day.session_count else 0
-            table.add_row(
+        table.add_rows([
+            (
                 day.date,
                 str(day.message_count),
                 str(day.session_count),
                 str(day.tool_call_count),
-                str(msgs_per_session),
+                str(day.message_count // day.session_count if day.session_count else 0),
             )
+            for day in reversed(stats)
+        ])
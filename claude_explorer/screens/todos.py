@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
-from textual.widgets import DataTable, Static, RichLog
+from textual.widgets import DataTable, LoadingIndicator, Static, RichLog
 from textual.message import Message
+from textual.worker import Worker, WorkerState
 
-from ..data.parsers import parse_todos, discover_all_sessions
+from ..data.parsers import parse_todos, discover_all_sessions, data_loaded
 from ..data.models import Session, SessionTodos, escape_markup
 
 
@@ -30,6 +33,9 @@ PRIORITY_COLOR = {
     "low": "#585b70",
 }
 
+# Detail texts kept for todo lists shown recently
+MAX_RENDERED = 32
+
 
 class TodosScreen(Container):
     """Browse todo lists from all Claude sessions."""
@@ -37,13 +43,19 @@ class TodosScreen(Container):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._todos: list[SessionTodos] = []
+        # Table row key ("session_id:agent_id") -> todo list and its session
+        self._todos_by_key: dict[str, tuple[SessionTodos, Session | None]] = {}
+        # Detail log text for recently shown todo lists, most recent last
+        self._rendered: OrderedDict[str, str] = OrderedDict()
         self._sessions_by_id: dict[str, Session] = {}
+        self._load_worker: Worker | None = None
 
     def compose(self) -> ComposeResult:
         yield Static(
             "[bold #cba6f7]  TODOS[/] [#a6adc8]- Task lists from Claude sessions (Enter to open)[/]",
             markup=True,
         )
+        yield LoadingIndicator(id="todos-loading")
         with Horizontal(id="todos-layout"):
             yield DataTable(id="todos-sessions-table")
             yield RichLog(id="todos-detail-log", wrap=True, markup=True)
@@ -52,19 +64,55 @@ class TodosScreen(Container):
         self.load_data()
 
     def load_data(self) -> None:
-        self._todos = parse_todos()
+        # Todo files and sessions are parsed off the event loop on a cold cache
+        if self._load_worker and self._load_worker.state == WorkerState.RUNNING:
+            self._load_worker.cancel()
+
+        if data_loaded("todos", "sessions"):
+            # Already warmed at startup: render now instead of flashing the indicator
+            self.query_one("#todos-loading").display = False
+            self._todos, self._sessions_by_id = self._load_todos()
+            self._render_todos()
+            return
 
-        sessions = discover_all_sessions()
-        self._sessions_by_id = {s.session_id: s for s in sessions}
+        self.query_one("#todos-loading").display = True
+        self._load_worker = self.run_worker(
+            self._load_todos,
+            thread=True,
+            name="load_todos",
+            exit_on_error=False,
+        )
+
+    @staticmethod
+    def _load_todos() -> tuple[list[SessionTodos], dict[str, Session]]:
+        return parse_todos(), {s.session_id: s for s in discover_all_sessions()}
 
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        if event.worker is not self._load_worker:
+            return
+
+        if event.state == WorkerState.SUCCESS:
+            self.query_one("#todos-loading").display = False
+            self._todos, self._sessions_by_id = event.worker.result
+            self._render_todos()
+        elif event.state == WorkerState.ERROR:
+            self.query_one("#todos-loading").display = False
+            log = self.query_one("#todos-detail-log", RichLog)
+            log.clear()
+            log.write(f"[#f38ba8]Failed to load todos: {escape_markup(str(event.worker.error))}[/]")
+
+    def _render_todos(self) -> None:
         table = self.query_one("#todos-sessions-table", DataTable)
-        table.clear(columns=True)
-        table.cursor_type = "row"
-        table.add_columns("Project", "Done", "Active", "Pending")
-        table.styles.width = 50
+        table.clear()
+        if not table.columns:
+            table.cursor_type = "row"
+            table.add_columns("Project", "Done", "Active", "Pending")
+            table.styles.width = 50
 
         log = self.query_one("#todos-detail-log", RichLog)
         log.clear()
+        self._todos_by_key = {}
+        self._rendered.clear()
 
         if not self._todos:
             log.write("[bold #cba6f7]No todos found[/]")
@@ -73,39 +121,34 @@ class TodosScreen(Container):
             log.write("[#cba6f7]TaskCreate / TodoWrite[/] [#a6adc8]tools during a session.[/]")
             return
 
+        total_items = total_done = 0
         for st in self._todos:
+            done = st.completed  # counted from the items on each access
+            total_items += len(st.items)
+            total_done += done
+            key = st.session_id + ":" + st.agent_id
             sess = self._sessions_by_id.get(st.session_id)
+            self._todos_by_key[key] = st, sess
             project = sess.project_short if sess else st.session_id[:10] + "..."
             table.add_row(
                 project,
-                str(st.completed),
+                str(done),
                 str(st.in_progress),
                 str(st.pending),
-                key=st.session_id + ":" + st.agent_id,
+                key=key,
             )
 
         # Show first entry by default
-        if self._todos:
-            self._show_todos(self._todos[0])
+        first = self._todos[0]
+        self._show_todos(*self._todos_by_key[first.session_id + ":" + first.agent_id])
 
-        total_items = sum(len(st.items) for st in self._todos)
-        total_done = sum(st.completed for st in self._todos)
         log.write(
             f"[#a6adc8]{len(self._todos)} sessions with todos — "
             f"{total_done}/{total_items} tasks completed[/]"
         )
 
     def _get_todo_from_key(self, composite: str) -> tuple[SessionTodos | None, Session | None]:
-        parts = composite.split(":", 1)
-        if len(parts) != 2:
-            return None, None
-        session_id, agent_id = parts
-        st = next(
-            (t for t in self._todos if t.session_id == session_id and t.agent_id == agent_id),
-            None,
-        )
-        sess = self._sessions_by_id.get(session_id) if st else None
-        return st, sess
+        return self._todos_by_key.get(composite, (None, None))
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Single click / Enter: show detail; Enter navigates to session."""
@@ -114,29 +157,39 @@ class TodosScreen(Container):
             return
         st, sess = self._get_todo_from_key(row_key.value)
         if st:
-            self._show_todos(st)
+            self._show_todos(st, sess)
             if sess:
                 self.post_message(TodoSessionSelected(sess))
 
-    def _show_todos(self, st: SessionTodos) -> None:
+    def _show_todos(self, st: SessionTodos, sess: Session | None) -> None:
         log = self.query_one("#todos-detail-log", RichLog)
         log.clear()
-
-        sess = self._sessions_by_id.get(st.session_id)
+        key = st.session_id + ":" + st.agent_id
+        text = self._rendered.get(key)
+        if text is None:
+            text = self._rendered[key] = self._todo_text(st, sess)
+            if len(self._rendered) > MAX_RENDERED:
+                self._rendered.popitem(last=False)
+        else:
+            self._rendered.move_to_end(key)
+        log.write(text)
+
+    def _todo_text(self, st: SessionTodos, sess: Session | None) -> str:
         project = sess.project_short if sess else "unknown"
-        log.write(f"[bold #cba6f7]Todo List[/]")
-        log.write(f"[#a6adc8]Project: {project}[/]")
-        log.write(f"[#a6adc8]Session: {st.session_id[:10]}...[/]")
-        log.write(
+        lines = [
+            "[bold #cba6f7]Todo List[/]",
+            f"[#a6adc8]Project: {project}[/]",
+            f"[#a6adc8]Session: {st.session_id[:10]}...[/]",
             f"[#a6adc8]{st.completed} done · "
             f"{st.in_progress} active · "
-            f"{st.pending} pending[/]"
-        )
-        log.write("[#45475a]" + "─" * 60 + "[/]")
-        log.write("")
+            f"{st.pending} pending[/]",
+            "[#45475a]" + "─" * 60 + "[/]",
+            "",
+        ]
 
         for item in st.items:
             icon = STATUS_ICON.get(item.status, "○")
             color = PRIORITY_COLOR.get(item.priority, "#cdd6f4")
             priority_tag = f"[#f38ba8][high][/] " if item.priority == "high" else ""
-            log.write(f"  {icon} {priority_tag}[{color}]{escape_markup(item.content)}[/]")
+            lines.append(f"  {icon} {priority_tag}[{color}]{escape_markup(item.content)}[/]")
+        return "\n".join(lines)